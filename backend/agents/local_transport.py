@@ -21,30 +21,33 @@ class LocalTransport:
         Returns a list of frames with agent-side timestamps so the hub can
         compute hold_gap_us from accurate, latency-free timing.
         """
-        deadline = time.time() + total_timeout_ms / 1000.0
+        deadline = time.monotonic() + total_timeout_ms / 1000.0
         frames: List[Dict[str, Any]] = []
 
         # First frame (initial press)
-        remaining_ms = int(max(0.0, (deadline - time.time()) * 1000.0))
+        remaining_ms = int(max(0.0, (deadline - time.monotonic()) * 1000.0))
         if remaining_ms <= 0:
             raise ValueError("total_timeout_ms too short")
-        raw, _stdout, _stderr = self._engine.receive_one_message(timeout_ms=remaining_ms)
-        captured_at_us = int(time.perf_counter() * 1_000_000)
-        frames.append({"raw": raw, "captured_at_us": captured_at_us})
-
-        # Subsequent frames until idle timeout or deadline
-        while True:
-            remaining_ms = int(max(0.0, (deadline - time.time()) * 1000.0))
-            if remaining_ms <= 0:
-                break
-            per_call_ms = min(idle_timeout_ms, remaining_ms)
-            try:
-                raw, _stdout, _stderr = self._engine.receive_one_message(timeout_ms=per_call_ms)
-            except TimeoutError:
-                break
+
+        # One receiver stays open for the whole hold instead of starting ir-ctl for every frame.
+        with self._engine.open_receive_stream() as stream:
+            raw = stream.read_message(timeout_ms=remaining_ms)
             captured_at_us = int(time.perf_counter() * 1_000_000)
             frames.append({"raw": raw, "captured_at_us": captured_at_us})
 
+            # Subsequent frames until idle timeout or deadline
+            while True:
+                remaining_ms = int(max(0.0, (deadline - time.monotonic()) * 1000.0))
+                if remaining_ms <= 0:
+                    break
+                per_call_ms = min(idle_timeout_ms, remaining_ms)
+                try:
+                    raw = stream.read_message(timeout_ms=per_call_ms)
+                except TimeoutError:
+                    break
+                captured_at_us = int(time.perf_counter() * 1_000_000)
+                frames.append({"raw": raw, "captured_at_us": captured_at_us})
+
         return {"frames": frames}
 
     def send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -18,6 +18,9 @@ class PairingManagerHub:
     PAIRING_UNPAIR_TOPIC_PREFIX = "ir/pairing/unpair"
     PAIRING_UNPAIR_ACK_WILDCARD_TOPIC = "ir/pairing/unpair_ack/+"
     PAIRING_RECLAIM_TOPIC_PREFIX = "ir/pairing/reclaim"
+    # Topic prefixes with the trailing separator, so per-call topics are a single concatenation.
+    _UNPAIR_TOPIC_BASE = f"{PAIRING_UNPAIR_TOPIC_PREFIX}/"
+    _RECLAIM_TOPIC_BASE = f"{PAIRING_RECLAIM_TOPIC_PREFIX}/"
     DEFAULT_WINDOW_SECONDS = 300
     UNPAIR_ACK_TIMEOUT_SECONDS = 8.0
 
@@ -39,10 +42,18 @@ class PairingManagerHub:
         self._subscribed_offers = False
         self._subscribed_unpair_acks = False
         self._session_id: Optional[str] = None
+        self._accept_topic_base = ""
         self._nonce: Optional[str] = None
         self._expires_at = 0.0
+        # Expiry checks use the monotonic clock; _expires_at (wall clock) is only published to agents.
+        self._expires_monotonic = 0.0
         self._close_timer: Optional[threading.Timer] = None
         self._pending_unpair_acks: Dict[str, Dict[str, Any]] = {}
+        # Both pairing wildcards share one callback; routing on the fixed topic prefix avoids re-parsing per handler.
+        self._topic_handlers = {
+            ("ir", "pairing", "offer"): self._on_offer,
+            ("ir", "pairing", "unpair_ack"): self._on_unpair_ack,
+        }
 
     def start(self) -> None:
         connection = self._runtime_loader.mqtt_connection()
@@ -94,8 +105,8 @@ class PairingManagerHub:
 
     def _subscribe(self, connection: Any) -> None:
         try:
-            connection.subscribe(self.PAIRING_OFFER_WILDCARD_TOPIC, self._on_offer, qos=QoS.AtLeastOnce)
-            connection.subscribe(self.PAIRING_UNPAIR_ACK_WILDCARD_TOPIC, self._on_unpair_ack, qos=QoS.AtLeastOnce)
+            connection.subscribe(self.PAIRING_OFFER_WILDCARD_TOPIC, self._on_pairing_message, qos=QoS.AtLeastOnce)
+            connection.subscribe(self.PAIRING_UNPAIR_ACK_WILDCARD_TOPIC, self._on_pairing_message, qos=QoS.AtLeastOnce)
         except Exception as exc:
             self._logger.warning(f"Failed to subscribe hub pairing topics: {exc}")
 
@@ -113,6 +124,7 @@ class PairingManagerHub:
         session_id = uuid.uuid4().hex
         nonce = uuid.uuid4().hex
         expires_at = time.time() + duration
+        expires_monotonic = time.monotonic() + duration
 
         mqtt_status = self._runtime_loader.status()
         hub_topic = str(mqtt_status.get("base_topic") or "")
@@ -137,8 +149,10 @@ class PairingManagerHub:
 
         with self._lock:
             self._session_id = session_id
+            self._accept_topic_base = f"{self.PAIRING_ACCEPT_TOPIC_PREFIX}/{session_id}/"
             self._nonce = nonce
             self._expires_at = expires_at
+            self._expires_monotonic = expires_monotonic
             if self._close_timer is not None:
                 self._close_timer.cancel()
             timer = threading.Timer(duration, self._auto_close_pairing, args=(session_id,))
@@ -155,8 +169,10 @@ class PairingManagerHub:
         with self._lock:
             previous_session = self._session_id
             self._session_id = None
+            self._accept_topic_base = ""
             self._nonce = None
             self._expires_at = 0.0
+            self._expires_monotonic = 0.0
             timer = self._close_timer
             self._close_timer = None
         if timer is not None:
@@ -185,10 +201,10 @@ class PairingManagerHub:
         with self._lock:
             active_session = self._session_id
             active_nonce = self._nonce
-            expires_at = self._expires_at
+            accept_topic_base = self._accept_topic_base
+            expires_monotonic = self._expires_monotonic
 
-        now = time.time()
-        if not active_session or not active_nonce or now >= expires_at:
+        if not active_session or not active_nonce or time.monotonic() >= expires_monotonic:
             raise RuntimeError("pairing_closed")
 
         agent = self._database.agents.get(normalized_agent_id)
@@ -207,9 +223,9 @@ class PairingManagerHub:
             "hub_name": self._runtime_loader.readable_name,
             "hub_topic": hub_status.get("base_topic"),
             "sw_version": self._sw_version,
-            "accepted_at": now,
+            "accepted_at": time.time(),
         }
-        accept_topic = f"{self.PAIRING_ACCEPT_TOPIC_PREFIX}/{active_session}/{normalized_agent_id}"
+        accept_topic = accept_topic_base + normalized_agent_id
         connection.publish(
             accept_topic,
             json.dumps(accept_payload, separators=(",", ":")),
@@ -314,7 +330,7 @@ class PairingManagerHub:
             "hub_topic": hub_topic,
             "reclaimed_at": time.time(),
         }
-        topic = f"{self.PAIRING_RECLAIM_TOPIC_PREFIX}/{normalized_agent_id}"
+        topic = self._RECLAIM_TOPIC_BASE + normalized_agent_id
         try:
             connection.publish(
                 topic,
@@ -335,22 +351,27 @@ class PairingManagerHub:
             return
         self.close_pairing()
 
-    def _on_offer(self, connection: Any, client: Any, userdata: Any, message: MQTTMessage) -> None:
-        session_from_topic, agent_uid_from_topic = self._parse_offer_topic(message.topic)
+    def _on_pairing_message(self, connection: Any, client: Any, userdata: Any, message: MQTTMessage) -> None:
+        parts = str(message.topic or "").split("/", 3)
+        if len(parts) != 4:
+            return
+        handler = self._topic_handlers.get((parts[0], parts[1], parts[2]))
+        if handler is None:
+            return
+        handler(parts[3], message)
+
+    def _on_offer(self, topic_suffix: str, message: MQTTMessage) -> None:
+        session_from_topic, agent_uid_from_topic = self._parse_offer_topic(topic_suffix)
         if not session_from_topic or not agent_uid_from_topic:
             return
 
         with self._lock:
             active_session = self._session_id
             active_nonce = self._nonce
-            expires_at = self._expires_at
+            expires_monotonic = self._expires_monotonic
 
-        now = time.time()
-        if not active_session or not active_nonce or now >= expires_at:
-            return
-        if session_from_topic != active_session:
+        if session_from_topic != active_session or not active_nonce or time.monotonic() >= expires_monotonic:
             return
-
         payload = self._parse_payload(message)
         if payload is None:
             return
@@ -383,7 +404,7 @@ class PairingManagerHub:
             can_learn=bool(payload.get("can_learn")),
             sw_version=agent_sw_version,
             agent_topic=agent_topic,
-            last_seen=now,
+            last_seen=time.time(),
             pending=True,
             pairing_session_id=active_session,
         )
@@ -412,7 +433,7 @@ class PairingManagerHub:
             "hub_topic": mqtt_status.get("base_topic"),
             "requested_at": time.time(),
         }
-        topic = f"{self.PAIRING_UNPAIR_TOPIC_PREFIX}/{agent_id}"
+        topic = self._UNPAIR_TOPIC_BASE + agent_id
         try:
             connection.publish(
                 topic,
@@ -432,8 +453,8 @@ class PairingManagerHub:
                 with self._lock:
                     self._pending_unpair_acks.pop(command_id, None)
 
-    def _on_unpair_ack(self, connection: Any, client: Any, userdata: Any, message: MQTTMessage) -> None:
-        agent_uid_from_topic = self._parse_unpair_ack_topic(message.topic)
+    def _on_unpair_ack(self, topic_suffix: str, message: MQTTMessage) -> None:
+        agent_uid_from_topic = self._parse_unpair_ack_topic(topic_suffix)
         if not agent_uid_from_topic:
             return
         payload = self._parse_payload(message)
@@ -456,21 +477,18 @@ class PairingManagerHub:
         if isinstance(event, threading.Event):
             event.set()
 
-    def _parse_offer_topic(self, topic: str) -> tuple[str, str]:
-        parts = str(topic or "").split("/")
-        if len(parts) != 5:
+    def _parse_offer_topic(self, topic_suffix: str) -> tuple[str, str]:
+        # topic_suffix is everything after "ir/pairing/offer/", expected as "<session_id>/<agent_uid>".
+        session_id, separator, agent_uid = topic_suffix.partition("/")
+        if not separator or "/" in agent_uid:
             return "", ""
-        if parts[0] != "ir" or parts[1] != "pairing" or parts[2] != "offer":
-            return "", ""
-        return parts[3].strip(), parts[4].strip()
+        return session_id.strip(), agent_uid.strip()
 
-    def _parse_unpair_ack_topic(self, topic: str) -> str:
-        parts = str(topic or "").split("/")
-        if len(parts) != 4:
-            return ""
-        if parts[0] != "ir" or parts[1] != "pairing" or parts[2] != "unpair_ack":
+    def _parse_unpair_ack_topic(self, topic_suffix: str) -> str:
+        # topic_suffix is everything after "ir/pairing/unpair_ack/", expected as "<agent_uid>".
+        if "/" in topic_suffix:
             return ""
-        return parts[3].strip()
+        return topic_suffix.strip()
 
     def _parse_payload(self, message: MQTTMessage) -> Optional[Dict[str, Any]]:
         value = message.json_value
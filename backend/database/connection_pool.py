@@ -0,0 +1,138 @@
+import logging
+import pathlib
+import queue
+import sqlite3
+import threading
+from typing import Callable, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Large enough that the statements of every table stay prepared on a long-lived connection.
+_CACHED_STATEMENTS = 512
+
+
+class ConnectionPool:
+    """Reusable SQLite connections for one database file.
+
+    Every thread gets its own long-lived read/write connection. Read-only connections are shared
+    through a small pool so short lookups never pay for opening the database files again.
+    """
+
+    def __init__(self, db_path: str, max_idle_readers: int = 8) -> None:
+        self._db_path = db_path
+        self._local = threading.local()
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=max_idle_readers)
+        self._reader_ids: Set[int] = set()
+        self._lock = threading.Lock()
+        # Serializes write transactions of this process. Waiting threads wake as soon as the previous
+        # transaction ends instead of polling the SQLite lock through the busy handler's sleeps.
+        # Nested write blocks join the enclosing transaction and never take it a second time.
+        self.write_lock = threading.Lock()
+
+    def writer(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "writer", None)
+        if conn is None:
+            conn = self._open_writer()
+            self._local.writer = conn
+        return conn
+
+    def write_block_open(self) -> bool:
+        """True while a write block holds this thread's writer in a transaction it will commit itself."""
+        return getattr(self._local, "write_depth", 0) > 0
+
+    def enter_write_block(self) -> None:
+        depth = getattr(self._local, "write_depth", 0)
+        if depth == 0:
+            self._local.after_commit = []
+        self._local.write_depth = depth + 1
+
+    def exit_write_block(self) -> List[Callable[[], None]]:
+        """Close a write block; the outermost one gets the callbacks to run once its commit succeeded."""
+        self._local.write_depth -= 1
+        if self._local.write_depth:
+            return []
+        callbacks, self._local.after_commit = self._local.after_commit, []
+        return callbacks
+
+    def call_after_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the open write block on this thread commits, or right away if none is open."""
+        if self.write_block_open():
+            self._local.after_commit.append(callback)
+        else:
+            callback()
+
+    def acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._idle_readers.get_nowait()
+        except queue.Empty:
+            pass
+        conn = self._open_reader()
+        with self._lock:
+            self._reader_ids.add(id(conn))
+        return conn
+
+    def prefill_readers(self, count: int) -> None:
+        """Open up to count idle readers ahead of time so the first requests find them ready."""
+        # All are taken before any is returned; the LIFO queue would otherwise hand back the same reader.
+        readers = [self.acquire_reader() for _ in range(max(0, count - self._idle_readers.qsize()))]
+        for conn in readers:
+            self.release(conn)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        # Discard work left behind by a call that failed mid-transaction.
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            is_reader = id(conn) in self._reader_ids
+        if not is_reader:
+            # Writers stay bound to their thread.
+            return
+        try:
+            self._idle_readers.put_nowait(conn)
+        except queue.Full:
+            with self._lock:
+                self._reader_ids.discard(id(conn))
+            conn.close()
+
+    def _open_writer(self) -> sqlite3.Connection:
+        # Implicit transactions open with BEGIN IMMEDIATE, which takes the write lock up front. sqlite3 only opens
+        # one before a DML statement, so write blocks issue BEGIN IMMEDIATE themselves to cover reads as well.
+        conn = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+            isolation_level="IMMEDIATE",
+        )
+        conn.row_factory = sqlite3.Row
+        # Only applies while the file is still empty; it has to precede WAL, which pins the page size.
+        conn.execute("PRAGMA page_size=4096;")
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL;").fetchone()[0]
+        conn.execute("PRAGMA foreign_keys=ON;")
+        self._apply_common_pragmas(conn)
+        if str(journal_mode).lower() != "wal":
+            # WAL is unavailable (e.g. a filesystem without shared memory support). NORMAL is only
+            # corruption-safe with WAL, so the rollback journal keeps SQLite's FULL default.
+            logger.warning(f"SQLite WAL mode unavailable for {self._db_path}, using journal_mode={journal_mode}")
+            return conn
+        # With WAL, synchronous=NORMAL only fsyncs at checkpoints: a power loss can drop the last
+        # commits, but the database file itself can never be corrupted.
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.execute("PRAGMA wal_autocheckpoint=1000;")
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        uri = f"{pathlib.Path(self._db_path).absolute().as_uri()}?mode=ro"
+        # Readers are handed between threads, so they must not be pinned to the creating thread.
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        self._apply_common_pragmas(conn)
+        return conn
+
+    def _apply_common_pragmas(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute("PRAGMA cache_size=-20000;")
+        # Reads are served from the memory-mapped file instead of read() calls into a private buffer.
+        conn.execute("PRAGMA mmap_size=268435456;")
+        # A writer whose BEGIN IMMEDIATE finds the database locked by another connection retries here instead of
+        # failing with SQLITE_BUSY right away.
+        conn.execute("PRAGMA busy_timeout=5000;")
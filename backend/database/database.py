@@ -1,27 +1,37 @@
 import os
+from typing import Set
+
 from database.database_base import DatabaseBase
 from database.schemas import (
     Remotes, Buttons, Signals, Captures, Settings, Agents, Marketplace,
     Scripts, ScriptSteps, ScriptRuns, ScriptRunSteps, Logs,
 )
 
+# Data directories already ensured by this process; avoids a makedirs stat per Database instance.
+_CREATED_DIRS: Set[str] = set()
+
+# Readers opened by init(); the UI, MQTT handlers and background loops rarely read concurrently beyond this.
+_PREFILLED_READERS = 4
+
 
 class Database(DatabaseBase):
     def __init__(self, data_dir: str) -> None:
         super().__init__(data_dir)
-        os.makedirs(self._data_dir, exist_ok=True)
-        self.remotes = Remotes(data_dir)
-        self.buttons = Buttons(data_dir)
-        self.signals = Signals(data_dir)
-        self.captures = Captures(data_dir)
-        self.settings = Settings(data_dir)
-        self.agents = Agents(data_dir)
-        self.marketplace = Marketplace(data_dir)
-        self.scripts = Scripts(data_dir)
-        self.script_steps = ScriptSteps(data_dir)
-        self.script_runs = ScriptRuns(data_dir)
-        self.script_run_steps = ScriptRunSteps(data_dir)
-        self.logs = Logs(data_dir)
+        if self._data_dir not in _CREATED_DIRS:
+            os.makedirs(self._data_dir, exist_ok=True)
+            _CREATED_DIRS.add(self._data_dir)
+        self.remotes = Remotes(data_dir, owner=self)
+        self.buttons = Buttons(data_dir, owner=self)
+        self.signals = Signals(data_dir, owner=self)
+        self.captures = Captures(data_dir, owner=self)
+        self.settings = Settings(data_dir, owner=self)
+        self.agents = Agents(data_dir, owner=self)
+        self.marketplace = Marketplace(data_dir, owner=self)
+        self.scripts = Scripts(data_dir, owner=self)
+        self.script_steps = ScriptSteps(data_dir, owner=self)
+        self.script_runs = ScriptRuns(data_dir, owner=self)
+        self.script_run_steps = ScriptRunSteps(data_dir, owner=self)
+        self.logs = Logs(data_dir, owner=self)
 
     def init(self) -> None:
         conn = self._connect()
@@ -41,5 +51,18 @@ class Database(DatabaseBase):
             self.logs._create_schema(conn)
             conn.commit()
         finally:
-            conn.close()
+            self._release(conn)
+        self.optimize()
+        # Readers can only open once the file exists; warm a few now instead of on the first requests.
+        self._pool.prefill_readers(_PREFILLED_READERS)
+
+    def optimize(self) -> None:
+        """Let SQLite refresh query planner statistics for tables whose contents changed noticeably."""
+        conn = self._connect()
+        try:
+            # Caps the rows ANALYZE samples per index so the call stays cheap on large tables.
+            conn.execute("PRAGMA analysis_limit=1000;")
+            conn.execute("PRAGMA optimize;")
+        finally:
+            self._release(conn)
             
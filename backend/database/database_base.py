@@ -1,21 +1,105 @@
 import os
 import sqlite3
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from database.connection_pool import ConnectionPool
+
+# Current Unix time in seconds (millisecond precision), computed by SQLite once per statement.
+# unixepoch('subsec') would be clearer but needs SQLite 3.42.
+SQL_NOW = "((julianday('now') - 2440587.5) * 86400.0)"
 
 
 class DatabaseBase:
-    def __init__(self, data_dir: str) -> None:
+    def __init__(self, data_dir: str, owner: Optional["DatabaseBase"] = None) -> None:
         self._data_dir = data_dir
         self._db_path = os.path.join(self._data_dir, "ir.db")
+        # Table classes created by Database delegate to their owner so all tables share one connection pool.
+        self._owner = owner if owner is not None else self
+        self._pool = ConnectionPool(self._db_path) if owner is None else None
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA foreign_keys=ON;")
-        return conn
+        return self._owner._pool.writer()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        self._owner._pool.release(conn)
 
-    def _use_conn(self, conn: Optional[sqlite3.Connection]) -> Tuple[sqlite3.Connection, bool]:
+    @contextmanager
+    def _read_conn(self, conn: Optional[sqlite3.Connection]) -> Iterator[sqlite3.Connection]:
+        # A caller-supplied connection is used as is so the read sees the caller's uncommitted writes; so does
+        # a read inside a write block on this thread. Otherwise a pooled read-only connection is borrowed for the
+        # block.
         if conn is not None:
-            return conn, False
-        return self._connect(), True
+            yield conn
+            return
+        if self._owner._pool.write_block_open():
+            yield self._connect()
+            return
+        c = self._owner._pool.acquire_reader()
+        try:
+            yield c
+        finally:
+            self._release(c)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into one transaction.
+
+        Pass the yielded connection as conn to the table methods; they then leave committing to this block,
+        which commits once on success and rolls back if it raises.
+        """
+        with self._write_conn(None) as c:
+            yield c
+
+    @contextmanager
+    def _write_conn(self, conn: Optional[sqlite3.Connection]) -> Iterator[sqlite3.Connection]:
+        # A caller-supplied connection stays in the caller's transaction. Otherwise the block runs in its own
+        # BEGIN IMMEDIATE transaction that commits on success and rolls back on error. Blocks of this process
+        # take turns on the pool's write lock, so they never contend inside SQLite.
+        if conn is not None:
+            yield conn
+            return
+        pool = self._owner._pool
+        if pool.write_block_open():
+            # A nested block joins the enclosing transaction; only the outermost block commits or rolls back.
+            yield self._connect()
+            return
+        c = self._connect()
+        try:
+            with pool.write_lock, c:
+                # sqlite3 would only BEGIN before the first INSERT/UPDATE/DELETE, leaving earlier reads of the block
+                # outside the transaction; opening it here takes SQLite's write lock before anything is read.
+                c.execute("BEGIN IMMEDIATE")
+                pool.enter_write_block()
+                try:
+                    yield c
+                finally:
+                    callbacks = pool.exit_write_block()
+        finally:
+            self._release(c)
+        # Only reached once the transaction committed; a rollback drops the callbacks with the writes.
+        for callback in callbacks:
+            callback()
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        # Inside a write block the callback waits for the block's commit, so it never runs ahead of the data.
+        self._owner._pool.call_after_commit(callback)
+
+    def _dict_cursor(self, conn: sqlite3.Connection, columns: Tuple[str, ...]) -> sqlite3.Cursor:
+        # For statements returning exactly these columns in this order: rows come out as dicts straight away,
+        # without a sqlite3.Row first or reading cursor.description per row.
+        cursor = conn.cursor()
+        cursor.row_factory = lambda _cursor, row: dict(zip(columns, row))
+        return cursor
+
+    def _clean_id(self, value: Any) -> str:
+        # str.strip() hands back the same object when there is nothing to strip, so clean ids cost no copy.
+        if type(value) is str:
+            return value.strip()
+        return str(value or "").strip()
+
+    def _require_id(self, value: Any, field_name: str) -> str:
+        normalized = self._clean_id(value)
+        if not normalized:
+            raise ValueError(f"{field_name} must not be empty")
+        return normalized
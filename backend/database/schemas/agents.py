@@ -1,8 +1,94 @@
 import sqlite3
-import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from database.database_base import DatabaseBase
+from database.database_base import SQL_NOW, DatabaseBase
+
+# Column order of every SELECT/RETURNING below; rows are converted by position against it.
+_COLUMNS = (
+    "agent_id",
+    "name",
+    "icon",
+    "transport",
+    "status",
+    "can_send",
+    "can_learn",
+    "sw_version",
+    "agent_topic",
+    "pending",
+    "pairing_session_id",
+    "last_seen",
+    "created_at",
+    "updated_at",
+)
+_COLUMN_LIST = ", ".join(_COLUMNS)
+
+_SQL_UPSERT = f"""
+INSERT INTO agents(
+    agent_id,
+    name,
+    icon,
+    transport,
+    status,
+    can_send,
+    can_learn,
+    sw_version,
+    agent_topic,
+    pending,
+    pairing_session_id,
+    last_seen,
+    created_at,
+    updated_at
+)
+VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {SQL_NOW}, {SQL_NOW})
+ON CONFLICT(agent_id) DO UPDATE SET
+    name = excluded.name,
+    icon = COALESCE(excluded.icon, agents.icon),
+    transport = excluded.transport,
+    status = excluded.status,
+    can_send = excluded.can_send,
+    can_learn = excluded.can_learn,
+    sw_version = excluded.sw_version,
+    agent_topic = excluded.agent_topic,
+    pending = excluded.pending,
+    pairing_session_id = excluded.pairing_session_id,
+    last_seen = excluded.last_seen,
+    updated_at = excluded.updated_at
+RETURNING {_COLUMN_LIST}
+"""
+_SQL_GET = f"SELECT {_COLUMN_LIST} FROM agents WHERE agent_id = ?"
+_SQL_LIST = f"SELECT {_COLUMN_LIST} FROM agents ORDER BY name, agent_id"
+# Each column takes a (changed, value) pair so a key that is absent from the changes keeps its stored value,
+# while an explicit None still clears it.
+_SQL_UPDATE_PROFILE = f"""
+UPDATE agents SET
+    name = CASE WHEN ? THEN ? ELSE name END,
+    icon = CASE WHEN ? THEN ? ELSE icon END,
+    updated_at = {SQL_NOW}
+WHERE agent_id = ?
+RETURNING {_COLUMN_LIST}
+"""
+_SQL_SET_STATUS = f"UPDATE agents SET status = ?, last_seen = ?, updated_at = {SQL_NOW} WHERE agent_id = ?"
+_SQL_UPDATE_LAST_SEEN = f"UPDATE agents SET last_seen = ?, updated_at = {SQL_NOW} WHERE agent_id = ?"
+_SQL_SET_PENDING = (
+    f"UPDATE agents SET pending = ?, pairing_session_id = ?, updated_at = {SQL_NOW} WHERE agent_id = ? "
+    f"RETURNING {_COLUMN_LIST}"
+)
+_SQL_DELETE_PENDING = "DELETE FROM agents WHERE pending = 1"
+_SQL_DELETE_PENDING_BY_SESSION = "DELETE FROM agents WHERE pending = 1 AND pairing_session_id = ?"
+_SQL_DELETE = f"DELETE FROM agents WHERE agent_id = ? RETURNING {_COLUMN_LIST}"
+
+
+# Database files whose agents table has already been migrated by this process.
+_MIGRATED_PATHS: Set[str] = set()
+
+
+def _norm(value: Optional[str], empty_to_none: bool = True) -> Optional[str]:
+    if value is None:
+        return None
+    normalized = value.strip() if type(value) is str else str(value).strip()
+    if empty_to_none and not normalized:
+        return None
+    return normalized
 
 
 class Agents(DatabaseBase):
@@ -25,14 +111,21 @@ class Agents(DatabaseBase):
                 created_at REAL NOT NULL,
                 updated_at REAL NOT NULL
             );
+
+            CREATE INDEX IF NOT EXISTS ix_agents_name ON agents(name, agent_id);
+            CREATE INDEX IF NOT EXISTS ix_agents_pending_session ON agents(pairing_session_id) WHERE pending = 1;
             """
         )
+        if self._db_path not in _MIGRATED_PATHS:
+            self._migrate(conn)
+            _MIGRATED_PATHS.add(self._db_path)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(agents)")}
         # Migration: drop configuration_url column if it still exists from an older schema.
-        try:
+        if "configuration_url" in columns:
             conn.execute("ALTER TABLE agents DROP COLUMN configuration_url")
             conn.commit()
-        except Exception:
-            pass
 
     def upsert(
         self,
@@ -50,77 +143,26 @@ class Agents(DatabaseBase):
         pairing_session_id: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        normalized_agent_id = str(agent_id or "").strip()
-        if not normalized_agent_id:
-            raise ValueError("agent_id must not be empty")
-
-        normalized_name = self._normalize_name(name)
-        normalized_icon = self._normalize_icon(icon)
-        normalized_sw_version = self._normalize_optional_text(sw_version)
-        normalized_agent_topic = self._normalize_optional_text(agent_topic)
-        normalized_pairing_session_id = self._normalize_optional_text(pairing_session_id)
+        params = self._upsert_params(
+            agent_id=agent_id,
+            name=name,
+            icon=icon,
+            transport=transport,
+            status=status,
+            can_send=can_send,
+            can_learn=can_learn,
+            sw_version=sw_version,
+            agent_topic=agent_topic,
+            last_seen=last_seen,
+            pending=pending,
+            pairing_session_id=pairing_session_id,
+        )
 
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
-            c.execute(
-                """
-                INSERT INTO agents(
-                    agent_id,
-                    name,
-                    icon,
-                    transport,
-                    status,
-                    can_send,
-                    can_learn,
-                    sw_version,
-                    agent_topic,
-                    pending,
-                    pairing_session_id,
-                    last_seen,
-                    created_at,
-                    updated_at
-                )
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(agent_id) DO UPDATE SET
-                    name = excluded.name,
-                    icon = COALESCE(excluded.icon, agents.icon),
-                    transport = excluded.transport,
-                    status = excluded.status,
-                    can_send = excluded.can_send,
-                    can_learn = excluded.can_learn,
-                    sw_version = excluded.sw_version,
-                    agent_topic = excluded.agent_topic,
-                    pending = excluded.pending,
-                    pairing_session_id = excluded.pairing_session_id,
-                    last_seen = excluded.last_seen,
-                    updated_at = excluded.updated_at
-                """,
-                (
-                    normalized_agent_id,
-                    normalized_name,
-                    normalized_icon,
-                    transport,
-                    status,
-                    self._to_int_bool(can_send),
-                    self._to_int_bool(can_learn),
-                    normalized_sw_version,
-                    normalized_agent_topic,
-                    self._to_int_bool(pending),
-                    normalized_pairing_session_id,
-                    last_seen,
-                    now,
-                    now,
-                ),
-            )
-            c.commit()
-            row = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            row = c.execute(_SQL_UPSERT, params).fetchone()
             if not row:
                 raise ValueError("Failed to upsert agent")
             return self._row_to_dict(row)
-        finally:
-            if close:
-                c.close()
 
     def update_agent(
         self,
@@ -128,39 +170,21 @@ class Agents(DatabaseBase):
         changes: Dict[str, Any],
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        normalized_agent_id = str(agent_id or "").strip()
-        if not normalized_agent_id:
-            raise ValueError("agent_id must not be empty")
-
-        c, close = self._use_conn(conn)
-        try:
-            existing = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
-            if not existing:
-                raise ValueError("Unknown agent_id")
-
-            existing_data = self._row_to_dict(existing)
-            next_name = existing_data.get("name")
-            next_icon = existing_data.get("icon")
+        normalized_agent_id = self._require_id(agent_id, "agent_id")
 
-            if "name" in changes:
-                next_name = self._normalize_name(changes.get("name"))
-            if "icon" in changes:
-                next_icon = self._normalize_icon(changes.get("icon"))
-
-            now = time.time()
-            c.execute(
-                "UPDATE agents SET name = ?, icon = ?, updated_at = ? WHERE agent_id = ?",
-                (next_name, next_icon, now, normalized_agent_id),
-            )
-            c.commit()
+        has_name = "name" in changes
+        has_icon = "icon" in changes
+        next_name = _norm(changes.get("name"), empty_to_none=False) if has_name else None
+        next_icon = _norm(changes.get("icon")) if has_icon else None
 
-            row = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            row = c.execute(
+                _SQL_UPDATE_PROFILE,
+                (int(has_name), next_name, int(has_icon), next_icon, normalized_agent_id),
+            ).fetchone()
             if not row:
                 raise ValueError("Unknown agent_id")
             return self._row_to_dict(row)
-        finally:
-            if close:
-                c.close()
 
     def set_status(
         self,
@@ -169,57 +193,37 @@ class Agents(DatabaseBase):
         last_seen: Optional[float] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> None:
-        normalized_agent_id = str(agent_id or "").strip()
+        normalized_agent_id = self._clean_id(agent_id)
         if not normalized_agent_id:
             return
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
+        with self._write_conn(conn) as c:
             c.execute(
-                "UPDATE agents SET status = ?, last_seen = ?, updated_at = ? WHERE agent_id = ?",
-                (status, last_seen, now, normalized_agent_id),
+                _SQL_SET_STATUS,
+                (status, last_seen, normalized_agent_id),
             )
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     def update_last_seen(self, agent_id: str, last_seen: Optional[float], conn: Optional[sqlite3.Connection] = None) -> None:
-        normalized_agent_id = str(agent_id or "").strip()
+        normalized_agent_id = self._clean_id(agent_id)
         if not normalized_agent_id:
             return
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
+        with self._write_conn(conn) as c:
             c.execute(
-                "UPDATE agents SET last_seen = ?, updated_at = ? WHERE agent_id = ?",
-                (last_seen, now, normalized_agent_id),
+                _SQL_UPDATE_LAST_SEEN,
+                (last_seen, normalized_agent_id),
             )
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     def get(self, agent_id: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        normalized_agent_id = str(agent_id or "").strip()
+        normalized_agent_id = self._clean_id(agent_id)
         if not normalized_agent_id:
             return None
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
+        with self._read_conn(conn) as c:
+            row = c.execute(_SQL_GET, (normalized_agent_id,)).fetchone()
             return self._row_to_dict(row) if row else None
-        finally:
-            if close:
-                c.close()
 
     def list(self, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
-            rows = c.execute("SELECT * FROM agents ORDER BY name, agent_id").fetchall()
+        with self._read_conn(conn) as c:
+            rows = c.execute(_SQL_LIST).fetchall()
             return [self._row_to_dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def set_pending_state(
         self,
@@ -228,102 +232,110 @@ class Agents(DatabaseBase):
         pairing_session_id: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        normalized_agent_id = str(agent_id or "").strip()
-        if not normalized_agent_id:
-            raise ValueError("agent_id must not be empty")
+        normalized_agent_id = self._require_id(agent_id, "agent_id")
 
-        normalized_pairing_session_id = self._normalize_optional_text(pairing_session_id)
+        normalized_pairing_session_id = _norm(pairing_session_id)
         if not pending:
             normalized_pairing_session_id = None
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown agent_id")
-
-            now = time.time()
-            c.execute(
-                "UPDATE agents SET pending = ?, pairing_session_id = ?, updated_at = ? WHERE agent_id = ?",
-                (self._to_int_bool(pending), normalized_pairing_session_id, now, normalized_agent_id),
-            )
-            c.commit()
-            updated = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            updated = c.execute(
+                _SQL_SET_PENDING,
+                (self._to_int_bool(pending), normalized_pairing_session_id, normalized_agent_id),
+            ).fetchone()
             if not updated:
                 raise ValueError("Unknown agent_id")
             return self._row_to_dict(updated)
-        finally:
-            if close:
-                c.close()
 
     def delete_pending(self, pairing_session_id: Optional[str] = None, conn: Optional[sqlite3.Connection] = None) -> int:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             if pairing_session_id:
-                result = c.execute(
-                    "DELETE FROM agents WHERE pending = 1 AND pairing_session_id = ?",
-                    (str(pairing_session_id),),
-                )
+                result = c.execute(_SQL_DELETE_PENDING_BY_SESSION, (str(pairing_session_id),))
             else:
-                result = c.execute("DELETE FROM agents WHERE pending = 1")
-            c.commit()
+                result = c.execute(_SQL_DELETE_PENDING)
             return int(result.rowcount or 0)
-        finally:
-            if close:
-                c.close()
 
     def delete(self, agent_id: str, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        normalized_agent_id = str(agent_id or "").strip()
-        if not normalized_agent_id:
-            raise ValueError("agent_id must not be empty")
+        normalized_agent_id = self._require_id(agent_id, "agent_id")
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT * FROM agents WHERE agent_id = ?", (normalized_agent_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            row = c.execute(_SQL_DELETE, (normalized_agent_id,)).fetchone()
             if not row:
                 raise ValueError("Unknown agent_id")
-            c.execute("DELETE FROM agents WHERE agent_id = ?", (normalized_agent_id,))
-            c.commit()
             return self._row_to_dict(row)
-        finally:
-            if close:
-                c.close()
+
+    def _upsert_params(
+        self,
+        agent_id: str,
+        name: Optional[str],
+        icon: Optional[str],
+        transport: str,
+        status: str,
+        can_send: bool,
+        can_learn: bool,
+        sw_version: Optional[str],
+        agent_topic: Optional[str],
+        last_seen: Optional[float],
+        pending: bool = False,
+        pairing_session_id: Optional[str] = None,
+    ) -> Tuple[Any, ...]:
+        normalized_agent_id = self._require_id(agent_id, "agent_id")
+
+        return (
+            normalized_agent_id,
+            _norm(name, empty_to_none=False),
+            _norm(icon),
+            transport,
+            status,
+            1 if can_send else 0,
+            1 if can_learn else 0,
+            _norm(sw_version),
+            _norm(agent_topic),
+            1 if pending else 0,
+            _norm(pairing_session_id),
+            last_seen,
+        )
 
     def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
-        data = dict(row)
-        can_send = bool(data.get("can_send"))
-        can_learn = bool(data.get("can_learn"))
-        pending = bool(data.get("pending"))
-        data["can_send"] = can_send
-        data["can_learn"] = can_learn
-        data["pending"] = pending
-        data["capabilities"] = {
+        # Unpacking follows _COLUMNS and skips sqlite3.Row's per-column name lookups.
+        (
+            agent_id,
+            name,
+            icon,
+            transport,
+            status,
+            can_send,
+            can_learn,
+            sw_version,
+            agent_topic,
+            pending,
+            pairing_session_id,
+            last_seen,
+            created_at,
+            updated_at,
+        ) = row
+        can_send = bool(can_send)
+        can_learn = bool(can_learn)
+        return {
+            "agent_id": agent_id,
+            "name": name,
+            "icon": icon,
+            "transport": transport,
+            "status": status,
             "can_send": can_send,
             "can_learn": can_learn,
+            "sw_version": sw_version,
+            "agent_topic": agent_topic,
+            "pending": bool(pending),
+            "pairing_session_id": pairing_session_id,
+            "last_seen": last_seen,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "capabilities": {
+                "can_send": can_send,
+                "can_learn": can_learn,
+            },
         }
-        return data
-
-    def _normalize_name(self, value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return None
-        normalized = str(value).strip()
-        return normalized
-
-    def _normalize_icon(self, value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return None
-        normalized = str(value).strip()
-        if not normalized:
-            return None
-        return normalized
-
-    def _normalize_optional_text(self, value: Optional[str]) -> Optional[str]:
-        if value is None:
-            return None
-        normalized = str(value).strip()
-        if not normalized:
-            return None
-        return normalized
 
     def _to_int_bool(self, value: bool) -> int:
         return 1 if bool(value) else 0
@@ -33,8 +33,7 @@ class Buttons(DatabaseBase):
         if not name:
             raise ValueError("Button name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             remote_row = c.execute("SELECT id FROM remotes WHERE id = ?", (remote_id,)).fetchone()
             if not remote_row:
                 raise ValueError("Unknown remote_id")
@@ -44,7 +43,6 @@ class Buttons(DatabaseBase):
                 "INSERT OR IGNORE INTO buttons(remote_id, name, icon, created_at, updated_at) VALUES(?, ?, ?, ?, ?)",
                 (remote_id, name, icon, now, now),
             )
-            c.commit()
 
             row = c.execute(
                 "SELECT id, remote_id, name, icon, created_at, updated_at FROM buttons WHERE remote_id = ? AND name = ?",
@@ -53,13 +51,9 @@ class Buttons(DatabaseBase):
             if not row:
                 raise ValueError("Failed to create button")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def get(self, button_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
                 "SELECT id, remote_id, name, icon, created_at, updated_at FROM buttons WHERE id = ?",
                 (button_id,),
@@ -67,25 +61,17 @@ class Buttons(DatabaseBase):
             if not row:
                 raise ValueError("Unknown button_id")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def get_by_name(self, remote_id: int, name: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
                 "SELECT id, remote_id, name, icon, created_at, updated_at FROM buttons WHERE remote_id = ? AND name = ?",
                 (remote_id, name.strip()),
             ).fetchone()
             return dict(row) if row else None
-        finally:
-            if close:
-                c.close()
 
     def list(self, remote_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 """
                 SELECT b.id, b.remote_id, b.name, b.icon, b.created_at, b.updated_at,
@@ -101,17 +87,13 @@ class Buttons(DatabaseBase):
                 (remote_id,),
             ).fetchall()
             return [dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def rename(self, button_id: int, name: str, icon: Optional[str] = None, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
         name = name.strip()
         if not name:
             raise ValueError("Button name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             current = c.execute("SELECT id, remote_id FROM buttons WHERE id = ?", (button_id,)).fetchone()
             if not current:
                 raise ValueError("Unknown button_id")
@@ -121,7 +103,6 @@ class Buttons(DatabaseBase):
                 "UPDATE buttons SET name = ?, icon = ?, updated_at = ? WHERE id = ?",
                 (name, icon, now, button_id),
             )
-            c.commit()
 
             out = c.execute(
                 "SELECT id, remote_id, name, icon, created_at, updated_at FROM buttons WHERE id = ?",
@@ -130,13 +111,9 @@ class Buttons(DatabaseBase):
             if not out:
                 raise ValueError("Unknown button_id")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def delete(self, button_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             row = c.execute(
                 "SELECT id, remote_id, name, icon, created_at, updated_at FROM buttons WHERE id = ?",
                 (button_id,),
@@ -145,9 +122,5 @@ class Buttons(DatabaseBase):
                 raise ValueError("Unknown button_id")
 
             c.execute("DELETE FROM buttons WHERE id = ?", (button_id,))
-            c.commit()
             return dict(row)
-        finally:
-            if close:
-                c.close()
                 
\ No newline at end of file
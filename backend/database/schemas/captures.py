@@ -1,8 +1,13 @@
 import sqlite3
-import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Tuple
 
-from database.database_base import DatabaseBase
+from database.database_base import SQL_NOW, DatabaseBase
+
+_SQL_INSERT = f"INSERT INTO captures(button_id, mode, take_index, raw_text, created_at) VALUES(?, ?, ?, ?, {SQL_NOW})"
+_SQL_CREATE = f"{_SQL_INSERT} RETURNING id, button_id, mode, take_index, raw_text, created_at"
+_SQL_CLEAR = "DELETE FROM captures"
+
+_MODES = frozenset(("press", "hold"))
 
 
 class Captures(DatabaseBase):
@@ -39,35 +44,46 @@ class Captures(DatabaseBase):
         raw_text: str,
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        mode = mode.strip().lower()
-        if mode not in ("press", "hold"):
-            raise ValueError("mode must be 'press' or 'hold'")
+        mode = self._normalize_mode(mode)
         if take_index < 0:
             raise ValueError("take_index must be >= 0")
 
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
-            c.execute(
-                "INSERT INTO captures(button_id, mode, take_index, raw_text, created_at) VALUES(?, ?, ?, ?, ?)",
-                (button_id, mode, take_index, raw_text, now),
-            )
-            c.commit()
+        with self._write_conn(conn) as c:
             row = c.execute(
-                "SELECT id, button_id, mode, take_index, raw_text, created_at FROM captures WHERE id = last_insert_rowid()"
+                _SQL_CREATE,
+                (button_id, mode, take_index, raw_text),
             ).fetchone()
             if not row:
                 raise ValueError("Failed to create capture")
             return dict(row)
-        finally:
-            if close:
-                c.close()
+
+    def create_many(
+        self,
+        button_id: int,
+        mode: str,
+        takes: Iterable[Tuple[int, str]],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> int:
+        """Store several (take_index, raw_text) captures of one button in a single transaction."""
+        mode = self._normalize_mode(mode)
+        rows = []
+        for take_index, raw_text in takes:
+            if take_index < 0:
+                raise ValueError("take_index must be >= 0")
+            rows.append((button_id, mode, take_index, raw_text))
+        if not rows:
+            return 0
+
+        with self._write_conn(conn) as c:
+            c.executemany(_SQL_INSERT, rows)
+            return len(rows)
 
     def clear(self, conn: Optional[sqlite3.Connection] = None) -> None:
-        c, close = self._use_conn(conn)
-        try:
-            c.execute("DELETE FROM captures")
-            c.commit()
-        finally:
-            if close:
-                c.close()
+        with self._write_conn(conn) as c:
+            c.execute(_SQL_CLEAR)
+
+    def _normalize_mode(self, mode: str) -> str:
+        normalized = mode.strip().lower()
+        if normalized not in _MODES:
+            raise ValueError("mode must be 'press' or 'hold'")
+        return normalized
@@ -34,8 +34,7 @@ class Logs(DatabaseBase):
         event: Dict[str, Any],
         conn: Optional[sqlite3.Connection] = None,
     ) -> None:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             meta = event.get("meta")
             meta_json = json.dumps(meta, separators=(",", ":")) if meta else None
             c.execute(
@@ -55,10 +54,6 @@ class Logs(DatabaseBase):
                     meta_json,
                 ),
             )
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     def query(
         self,
@@ -71,17 +66,13 @@ class Logs(DatabaseBase):
         limit: int = 200,
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             where, params = self._build_where(levels, source_types, source_ids, categories, from_ts, to_ts)
             bounded = max(1, min(int(limit or 0), 1000))
             sql = f"SELECT * FROM logs{where} ORDER BY ts ASC LIMIT ?"
             params.append(bounded)
             rows = c.execute(sql, params).fetchall()
             return [self._row_to_dict(row) for row in rows]
-        finally:
-            if close:
-                c.close()
 
     def delete(
         self,
@@ -93,27 +84,17 @@ class Logs(DatabaseBase):
         to_ts: Optional[float] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> int:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             where, params = self._build_where(levels, source_types, source_ids, categories, from_ts, to_ts)
             sql = f"DELETE FROM logs{where}"
             cursor = c.execute(sql, params)
-            c.commit()
             return cursor.rowcount
-        finally:
-            if close:
-                c.close()
 
     def prune(self, retention_days: int, conn: Optional[sqlite3.Connection] = None) -> int:
         cutoff = time.time() - max(0, int(retention_days)) * 86400
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             cursor = c.execute("DELETE FROM logs WHERE ts < ?", (cutoff,))
-            c.commit()
             return cursor.rowcount
-        finally:
-            if close:
-                c.close()
 
     def _build_where(
         self,
@@ -48,43 +48,29 @@ class Marketplace(DatabaseBase):
     # ------------------------------------------------------------------
 
     def get_meta(self, key: str, conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute("SELECT value FROM marketplace_meta WHERE key = ?", (key,)).fetchone()
             return row[0] if row else None
-        finally:
-            if close:
-                c.close()
 
     def set_meta(self, key: str, value: str, conn: Optional[sqlite3.Connection] = None) -> None:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             c.execute(
                 "INSERT INTO marketplace_meta(key, value) VALUES(?,?) "
                 "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
                 (key, value),
             )
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     def count(self, conn: Optional[sqlite3.Connection] = None) -> int:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute("SELECT COUNT(*) FROM marketplace_remotes").fetchone()
             return int(row[0]) if row else 0
-        finally:
-            if close:
-                c.close()
 
     def list_paths_and_shas(
         self,
         source: Optional[str] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             if source:
                 rows = c.execute(
                     "SELECT path, sha FROM marketplace_remotes WHERE source = ?", (source,)
@@ -92,19 +78,11 @@ class Marketplace(DatabaseBase):
             else:
                 rows = c.execute("SELECT path, sha FROM marketplace_remotes").fetchall()
             return [dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def delete_by_paths(self, paths: List[str], conn: Optional[sqlite3.Connection] = None) -> None:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             for path in paths:
                 c.execute("DELETE FROM marketplace_remotes WHERE path = ?", (path,))
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     def upsert(
         self,
@@ -118,8 +96,7 @@ class Marketplace(DatabaseBase):
         conn: Optional[sqlite3.Connection] = None,
     ) -> None:
         """Insert or update a marketplace remote and replace its buttons."""
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             now = time.time()
             existing = c.execute(
                 "SELECT id FROM marketplace_remotes WHERE path = ?", (path,)
@@ -147,10 +124,6 @@ class Marketplace(DatabaseBase):
                     (remote_id, btn.get("name", ""), signal_type, protocol),
                 )
 
-            c.commit()
-        finally:
-            if close:
-                c.close()
 
     # ------------------------------------------------------------------
     # Search
@@ -183,8 +156,7 @@ class Marketplace(DatabaseBase):
 
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             remotes = c.execute(
                 f"SELECT * FROM marketplace_remotes {where} ORDER BY brand, model",
                 params,
@@ -201,35 +173,23 @@ class Marketplace(DatabaseBase):
                 result.append(remote_dict)
 
             return result
-        finally:
-            if close:
-                c.close()
 
     def get_by_path(self, path: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute("SELECT * FROM marketplace_remotes WHERE path = ?", (path,)).fetchone()
             return dict(row) if row else None
-        finally:
-            if close:
-                c.close()
 
     def list_categories(self, conn: Optional[sqlite3.Connection] = None) -> List[str]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 "SELECT DISTINCT category FROM marketplace_remotes ORDER BY category"
             ).fetchall()
             return [r[0] for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def list_brands(
         self, category: Optional[str] = None, conn: Optional[sqlite3.Connection] = None
     ) -> List[str]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             if category:
                 rows = c.execute(
                     "SELECT DISTINCT brand FROM marketplace_remotes WHERE category = ? ORDER BY brand",
@@ -240,6 +200,3 @@ class Marketplace(DatabaseBase):
                     "SELECT DISTINCT brand FROM marketplace_remotes ORDER BY brand"
                 ).fetchall()
             return [r[0] for r in rows]
-        finally:
-            if close:
-                c.close()
@@ -1,6 +1,6 @@
 import sqlite3
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 
 from database.database_base import DatabaseBase
 
@@ -9,6 +9,36 @@ _SELECT_COLS = (
     "marketplace_source, marketplace_path, created_at, updated_at"
 )
 
+# Creating an existing name returns the stored remote unchanged; the no-op DO UPDATE only exists so RETURNING
+# yields that row in the same statement.
+_SQL_INSERT = (
+    "INSERT INTO remotes("
+    "name, icon, assigned_agent_id, carrier_hz, duty_cycle, "
+    "marketplace_source, marketplace_path, created_at, updated_at"
+    ") VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET updated_at = remotes.updated_at "
+    f"RETURNING {_SELECT_COLS}"
+)
+_SQL_UPDATE = (
+    "UPDATE remotes SET name = ?, icon = ?, assigned_agent_id = ?, "
+    f"carrier_hz = ?, duty_cycle = ?, updated_at = ? WHERE id = ? RETURNING {_SELECT_COLS}"
+)
+_SQL_EXISTS = "SELECT id FROM remotes WHERE id = ?"
+_SQL_GET = f"SELECT {_SELECT_COLS} FROM remotes WHERE id = ?"
+_SQL_GET_BY_NAME = f"SELECT {_SELECT_COLS} FROM remotes WHERE name = ?"
+_SQL_GET_BY_MARKETPLACE_PATH = f"SELECT {_SELECT_COLS} FROM remotes WHERE marketplace_path = ?"
+_SQL_LIST = f"SELECT {_SELECT_COLS} FROM remotes ORDER BY name"
+_SQL_LIST_MARKETPLACE_PATHS = "SELECT marketplace_path FROM remotes WHERE marketplace_path IS NOT NULL"
+_SQL_DELETE = f"DELETE FROM remotes WHERE id = ? RETURNING {_SELECT_COLS}"
+_SQL_DELETE_BUTTONS = "DELETE FROM buttons WHERE remote_id = ?"
+_SQL_SET_ASSIGNED_AGENT = (
+    f"UPDATE remotes SET assigned_agent_id = ?, updated_at = ? WHERE id = ? RETURNING {_SELECT_COLS}"
+)
+_SQL_CLEAR_ASSIGNED_AGENT = "UPDATE remotes SET assigned_agent_id = NULL, updated_at = ? WHERE assigned_agent_id = ?"
+
+
+_COLUMNS = tuple(column.strip() for column in _SELECT_COLS.split(","))
+
 
 class Remotes(DatabaseBase):
     # -----------------------------
@@ -30,6 +60,11 @@ class Remotes(DatabaseBase):
                 created_at         REAL NOT NULL,
                 updated_at         REAL NOT NULL
             );
+
+            CREATE INDEX IF NOT EXISTS ix_remotes_marketplace_path
+                ON remotes(marketplace_path) WHERE marketplace_path IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS ix_remotes_assigned_agent_id
+                ON remotes(assigned_agent_id) WHERE assigned_agent_id IS NOT NULL;
             """
         )
 
@@ -51,29 +86,16 @@ class Remotes(DatabaseBase):
         if not name:
             raise ValueError("Remote name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "INSERT OR IGNORE INTO remotes("
-                "name, icon, assigned_agent_id, carrier_hz, duty_cycle, "
-                "marketplace_source, marketplace_path, created_at, updated_at"
-                ") VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            row = c.execute(
+                _SQL_INSERT,
                 (name, icon, assigned_agent_id, carrier_hz, duty_cycle,
                  marketplace_source, marketplace_path, now, now),
-            )
-            c.commit()
-
-            row = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE name = ?",
-                (name,),
             ).fetchone()
             if not row:
                 raise ValueError("Failed to create remote")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def update(
         self,
@@ -89,165 +111,97 @@ class Remotes(DatabaseBase):
         if not name:
             raise ValueError("Remote name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM remotes WHERE id = ?", (remote_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown remote_id")
-
+        with self._write_conn(conn) as c:
+            # RETURNING yields no row for an unknown id, so no separate existence probe is needed.
             now = time.time()
-            c.execute(
-                "UPDATE remotes SET name = ?, icon = ?, assigned_agent_id = ?, "
-                "carrier_hz = ?, duty_cycle = ?, updated_at = ? WHERE id = ?",
-                (name, icon, assigned_agent_id, carrier_hz, duty_cycle, now, remote_id),
-            )
-            c.commit()
-
             out = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE id = ?",
-                (remote_id,),
+                _SQL_UPDATE,
+                (name, icon, assigned_agent_id, carrier_hz, duty_cycle, now, remote_id),
             ).fetchone()
+
             if not out:
                 raise ValueError("Unknown remote_id")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def delete(self, remote_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE id = ?",
-                (remote_id,),
-            ).fetchone()
+        with self._write_conn(conn) as c:
+            row = c.execute(_SQL_DELETE, (remote_id,)).fetchone()
             if not row:
                 raise ValueError("Unknown remote_id")
-
-            c.execute("DELETE FROM remotes WHERE id = ?", (remote_id,))
-            c.commit()
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def get(self, remote_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE id = ?",
+                _SQL_GET,
                 (remote_id,),
             ).fetchone()
             if not row:
                 raise ValueError("Unknown remote_id")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def get_by_name(self, name: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE name = ?",
+                _SQL_GET_BY_NAME,
                 (name.strip(),),
             ).fetchone()
             return dict(row) if row else None
-        finally:
-            if close:
-                c.close()
 
     def get_by_marketplace_path(self, path: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE marketplace_path = ?",
+                _SQL_GET_BY_MARKETPLACE_PATH,
                 (path,),
             ).fetchone()
             return dict(row) if row else None
-        finally:
-            if close:
-                c.close()
 
     def list(self, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
-            rows = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes ORDER BY name"
-            ).fetchall()
-            return [dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
+        return list(self.iter_list(conn=conn))
+
+    def iter_list(self, conn: Optional[sqlite3.Connection] = None) -> Iterator[Dict[str, Any]]:
+        """Yield remotes ordered by name; the connection is held until the iterator is exhausted or closed."""
+        with self._read_conn(conn) as c:
+            yield from self._dict_cursor(c, _COLUMNS).execute(_SQL_LIST)
 
     def list_marketplace_paths(self, conn: Optional[sqlite3.Connection] = None) -> List[str]:
         """Return all marketplace_path values of installed remotes."""
-        c, close = self._use_conn(conn)
-        try:
-            rows = c.execute(
-                "SELECT marketplace_path FROM remotes WHERE marketplace_path IS NOT NULL"
-            ).fetchall()
+        with self._read_conn(conn) as c:
+            rows = c.execute(_SQL_LIST_MARKETPLACE_PATHS).fetchall()
             return [r[0] for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def clear_buttons(self, remote_id: int, conn: Optional[sqlite3.Connection] = None) -> None:
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM remotes WHERE id = ?", (remote_id,)).fetchone()
-            if not row:
+        with self._write_conn(conn) as c:
+            result = c.execute(_SQL_DELETE_BUTTONS, (remote_id,))
+            # Only an empty delete needs the probe that tells "no buttons" from "unknown remote".
+            if not result.rowcount and not c.execute(_SQL_EXISTS, (remote_id,)).fetchone():
                 raise ValueError("Unknown remote_id")
 
-            c.execute("DELETE FROM buttons WHERE remote_id = ?", (remote_id,))
-            c.commit()
-        finally:
-            if close:
-                c.close()
-
     def set_assigned_agent(
         self,
         remote_id: int,
         assigned_agent_id: Optional[str],
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM remotes WHERE id = ?", (remote_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown remote_id")
-
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "UPDATE remotes SET assigned_agent_id = ?, updated_at = ? WHERE id = ?",
-                (assigned_agent_id, now, remote_id),
-            )
-            c.commit()
             out = c.execute(
-                f"SELECT {_SELECT_COLS} FROM remotes WHERE id = ?",
-                (remote_id,),
+                _SQL_SET_ASSIGNED_AGENT,
+                (assigned_agent_id, now, remote_id),
             ).fetchone()
             if not out:
                 raise ValueError("Unknown remote_id")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def clear_assigned_agent(self, agent_id: str, conn: Optional[sqlite3.Connection] = None) -> int:
-        normalized_agent_id = str(agent_id or "").strip()
+        normalized_agent_id = self._clean_id(agent_id)
         if not normalized_agent_id:
             return 0
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             now = time.time()
             result = c.execute(
-                "UPDATE remotes SET assigned_agent_id = NULL, updated_at = ? WHERE assigned_agent_id = ?",
+                _SQL_CLEAR_ASSIGNED_AGENT,
                 (now, normalized_agent_id),
             )
-            c.commit()
             return int(result.rowcount or 0)
-        finally:
-            if close:
-                c.close()
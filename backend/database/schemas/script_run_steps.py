@@ -37,42 +37,29 @@ class ScriptRunSteps(DatabaseBase):
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
         """Insert all expanded step rows for a run in one transaction. Each step: {position, label, type, params}."""
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             row = c.execute("SELECT id FROM script_runs WHERE id = ?", (run_id,)).fetchone()
             if not row:
                 raise ValueError("Unknown run_id")
 
             for step in steps:
-                params_json = json.dumps(step.get("params", {}), ensure_ascii=False)
+                params_json = json.dumps(step.get("params", {}), separators=(",", ":"), ensure_ascii=False)
                 c.execute(
                     "INSERT INTO script_run_steps(run_id, position, label, type, params, status) "
                     "VALUES(?, ?, ?, ?, ?, 'pending')",
                     (run_id, step["position"], step["label"], step["type"], params_json),
                 )
-            c.commit()
             return self.list(run_id, conn=c)
-        finally:
-            if close:
-                c.close()
 
     def start(self, step_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM script_run_steps WHERE id = ?", (step_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown step_id")
-
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "UPDATE script_run_steps SET status = 'running', started_at = ? WHERE id = ?",
+            row = c.execute(
+                "UPDATE script_run_steps SET status = 'running', started_at = ? WHERE id = ? "
+                "RETURNING id, run_id, position, label, type, params, status, error, started_at, finished_at",
                 (now, step_id),
-            )
-            c.commit()
-            return self._fetch(step_id, c)
-        finally:
-            if close:
-                c.close()
+            ).fetchone()
+            return self._row_to_entry(row)
 
     def finish(
         self,
@@ -84,26 +71,17 @@ class ScriptRunSteps(DatabaseBase):
         if status not in _VALID_STATUSES:
             raise ValueError(f"Invalid step status: {status!r}")
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM script_run_steps WHERE id = ?", (step_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown step_id")
-
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "UPDATE script_run_steps SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+            row = c.execute(
+                "UPDATE script_run_steps SET status = ?, error = ?, finished_at = ? WHERE id = ? "
+                "RETURNING id, run_id, position, label, type, params, status, error, started_at, finished_at",
                 (status, error, now, step_id),
-            )
-            c.commit()
-            return self._fetch(step_id, c)
-        finally:
-            if close:
-                c.close()
+            ).fetchone()
+            return self._row_to_entry(row)
 
     def list(self, run_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 "SELECT id, run_id, position, label, type, params, status, error, started_at, finished_at "
                 "FROM script_run_steps WHERE run_id = ? ORDER BY position",
@@ -115,16 +93,8 @@ class ScriptRunSteps(DatabaseBase):
                 entry["params"] = json.loads(entry["params"])
                 result.append(entry)
             return result
-        finally:
-            if close:
-                c.close()
 
-    def _fetch(self, step_id: int, conn: sqlite3.Connection) -> Dict[str, Any]:
-        row = conn.execute(
-            "SELECT id, run_id, position, label, type, params, status, error, started_at, finished_at "
-            "FROM script_run_steps WHERE id = ?",
-            (step_id,),
-        ).fetchone()
+    def _row_to_entry(self, row: Optional[sqlite3.Row]) -> Dict[str, Any]:
         if not row:
             raise ValueError("Unknown step_id")
         entry = dict(row)
@@ -25,8 +25,7 @@ class ScriptRuns(DatabaseBase):
         )
 
     def create(self, script_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             row = c.execute("SELECT id FROM scripts WHERE id = ?", (script_id,)).fetchone()
             if not row:
                 raise ValueError("Unknown script_id")
@@ -36,7 +35,6 @@ class ScriptRuns(DatabaseBase):
                 "INSERT INTO script_runs(script_id, status, started_at) VALUES(?, 'running', ?)",
                 (script_id, now),
             )
-            c.commit()
             out = c.execute(
                 "SELECT id, script_id, status, started_at, finished_at "
                 "FROM script_runs WHERE id = last_insert_rowid()"
@@ -44,9 +42,6 @@ class ScriptRuns(DatabaseBase):
             if not out:
                 raise ValueError("Failed to create script run")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def finish(
         self,
@@ -57,32 +52,19 @@ class ScriptRuns(DatabaseBase):
         if status not in _VALID_STATUSES:
             raise ValueError(f"Invalid run status: {status!r}")
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM script_runs WHERE id = ?", (run_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown run_id")
-
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "UPDATE script_runs SET status = ?, finished_at = ? WHERE id = ?",
-                (status, now, run_id),
-            )
-            c.commit()
             out = c.execute(
-                "SELECT id, script_id, status, started_at, finished_at FROM script_runs WHERE id = ?",
-                (run_id,),
+                "UPDATE script_runs SET status = ?, finished_at = ? WHERE id = ? "
+                "RETURNING id, script_id, status, started_at, finished_at",
+                (status, now, run_id),
             ).fetchone()
             if not out:
                 raise ValueError("Unknown run_id")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def get(self, run_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
                 "SELECT id, script_id, status, started_at, finished_at FROM script_runs WHERE id = ?",
                 (run_id,),
@@ -90,27 +72,19 @@ class ScriptRuns(DatabaseBase):
             if not row:
                 raise ValueError("Unknown run_id")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def list(self, script_id: int, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 "SELECT id, script_id, status, started_at, finished_at "
                 "FROM script_runs WHERE script_id = ? ORDER BY started_at DESC",
                 (script_id,),
             ).fetchall()
             return [dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def prune(self, script_id: int, max_runs: int, conn: Optional[sqlite3.Connection] = None) -> int:
         """Delete oldest runs beyond max_runs for a script. Returns number of deleted rows."""
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             result = c.execute(
                 """
                 DELETE FROM script_runs
@@ -124,8 +98,4 @@ class ScriptRuns(DatabaseBase):
                 """,
                 (script_id, script_id, max_runs),
             )
-            c.commit()
             return int(result.rowcount or 0)
-        finally:
-            if close:
-                c.close()
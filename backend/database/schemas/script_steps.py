@@ -32,8 +32,7 @@ class ScriptSteps(DatabaseBase):
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
         """Replace all steps for a script atomically. steps is an ordered list of {type, params}."""
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             row = c.execute("SELECT id FROM scripts WHERE id = ?", (script_id,)).fetchone()
             if not row:
                 raise ValueError("Unknown script_id")
@@ -43,24 +42,19 @@ class ScriptSteps(DatabaseBase):
                 step_type = str(step.get("type", "")).strip()
                 if step_type not in _VALID_TYPES:
                     raise ValueError(f"Invalid step type: {step_type!r}")
-                params_json = json.dumps(step.get("params", {}), ensure_ascii=False)
+                params_json = json.dumps(step.get("params", {}), separators=(",", ":"), ensure_ascii=False)
                 c.execute(
                     "INSERT INTO script_steps(script_id, position, type, params) VALUES(?, ?, ?, ?)",
                     (script_id, position, step_type, params_json),
                 )
-            c.commit()
             return self.get_steps(script_id, conn=c)
-        finally:
-            if close:
-                c.close()
 
     def get_steps(
         self,
         script_id: int,
         conn: Optional[sqlite3.Connection] = None,
     ) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 "SELECT id, script_id, position, type, params FROM script_steps "
                 "WHERE script_id = ? ORDER BY position",
@@ -72,6 +66,3 @@ class ScriptSteps(DatabaseBase):
                 entry["params"] = json.loads(entry["params"])
                 result.append(entry)
             return result
-        finally:
-            if close:
-                c.close()
@@ -29,27 +29,21 @@ class Scripts(DatabaseBase):
         if not name:
             raise ValueError("Script name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             now = time.time()
             c.execute(
                 "INSERT INTO scripts(name, description, created_at, updated_at) VALUES(?, ?, ?, ?)",
                 (name, description, now, now),
             )
-            c.commit()
             row = c.execute(
                 "SELECT id, name, description, created_at, updated_at FROM scripts WHERE id = last_insert_rowid()"
             ).fetchone()
             if not row:
                 raise ValueError("Failed to create script")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def get(self, script_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             row = c.execute(
                 "SELECT id, name, description, created_at, updated_at FROM scripts WHERE id = ?",
                 (script_id,),
@@ -57,20 +51,13 @@ class Scripts(DatabaseBase):
             if not row:
                 raise ValueError("Unknown script_id")
             return dict(row)
-        finally:
-            if close:
-                c.close()
 
     def list(self, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._read_conn(conn) as c:
             rows = c.execute(
                 "SELECT id, name, description, created_at, updated_at FROM scripts ORDER BY name"
             ).fetchall()
             return [dict(r) for r in rows]
-        finally:
-            if close:
-                c.close()
 
     def update(
         self,
@@ -83,42 +70,23 @@ class Scripts(DatabaseBase):
         if not name:
             raise ValueError("Script name must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT id FROM scripts WHERE id = ?", (script_id,)).fetchone()
-            if not row:
-                raise ValueError("Unknown script_id")
-
+        with self._write_conn(conn) as c:
             now = time.time()
-            c.execute(
-                "UPDATE scripts SET name = ?, description = ?, updated_at = ? WHERE id = ?",
-                (name, description, now, script_id),
-            )
-            c.commit()
             out = c.execute(
-                "SELECT id, name, description, created_at, updated_at FROM scripts WHERE id = ?",
-                (script_id,),
+                "UPDATE scripts SET name = ?, description = ?, updated_at = ? WHERE id = ? "
+                "RETURNING id, name, description, created_at, updated_at",
+                (name, description, now, script_id),
             ).fetchone()
             if not out:
                 raise ValueError("Unknown script_id")
             return dict(out)
-        finally:
-            if close:
-                c.close()
 
     def delete(self, script_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             row = c.execute(
-                "SELECT id, name, description, created_at, updated_at FROM scripts WHERE id = ?",
+                "DELETE FROM scripts WHERE id = ? RETURNING id, name, description, created_at, updated_at",
                 (script_id,),
             ).fetchone()
             if not row:
                 raise ValueError("Unknown script_id")
-
-            c.execute("DELETE FROM scripts WHERE id = ?", (script_id,))
-            c.commit()
             return dict(row)
-        finally:
-            if close:
-                c.close()
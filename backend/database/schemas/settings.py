@@ -1,12 +1,149 @@
 import sqlite3
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from database.database_base import DatabaseBase
 from helper.settings_cipher import SettingsCipher
 
+_SQL_GET = "SELECT value FROM app_settings WHERE key = ?"
+_SQL_ALL = "SELECT key, value FROM app_settings"
+_SQL_WRITE = "INSERT OR REPLACE INTO app_settings(key, value, updated_at) VALUES(?, ?, ?)"
+
+_LEARNING_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "press_takes_default": 5,
+    "capture_timeout_ms_default": 3000,
+    "hold_idle_timeout_ms": 300,
+    "aggregate_round_to_us": 10,
+    "aggregate_min_match_ratio": 0.6,
+})
+
+# (key, kind, default, (min, max)) entries; kind is one of "text", "int", "float" or "bool".
+_SchemaEntry = Tuple[str, str, Any, Optional[Tuple[Any, Any]]]
+
+_GENERAL_SCHEMA: Tuple[_SchemaEntry, ...] = (
+    ("theme", "text", "system", None),
+    ("language", "text", "en", None),
+    ("hub_is_agent", "bool", True, None),
+    ("homeassistant_enabled", "bool", False, None),
+    ("hub_public_url", "text", "", None),
+)
+_MQTT_SCHEMA: Tuple[_SchemaEntry, ...] = (
+    ("mqtt_host", "text", "", None),
+    ("mqtt_port", "int", 1883, (1, 65535)),
+    ("mqtt_username", "text", "", None),
+    ("mqtt_instance", "text", "", None),
+)
+_LEARNING_SCHEMA: Tuple[_SchemaEntry, ...] = (
+    ("press_takes_default", "int", _LEARNING_DEFAULTS["press_takes_default"], (1, 50)),
+    ("capture_timeout_ms_default", "int", _LEARNING_DEFAULTS["capture_timeout_ms_default"], (100, 60000)),
+    ("hold_idle_timeout_ms", "int", _LEARNING_DEFAULTS["hold_idle_timeout_ms"], (50, 2000)),
+    ("aggregate_round_to_us", "int", _LEARNING_DEFAULTS["aggregate_round_to_us"], (1, 1000)),
+    ("aggregate_min_match_ratio", "float", _LEARNING_DEFAULTS["aggregate_min_match_ratio"], (0.1, 1.0)),
+)
+_SCRIPT_SCHEMA: Tuple[_SchemaEntry, ...] = (
+    ("script_max_runs", "int", 10, (1, 100)),
+)
+_LOG_SCHEMA: Tuple[_SchemaEntry, ...] = (
+    ("log_retention_days", "int", 7, (1, 365)),
+)
+_MQTT_PASSWORD_KEYS = ("mqtt_password_ciphertext", "mqtt_password_nonce")
+
+# (statement, keys) reading exactly the rows one aggregate getter needs in a single query.
+_ValuesQuery = Tuple[str, Tuple[str, ...]]
+
+
+def _values_query(*schemas: Tuple[_SchemaEntry, ...], extra_keys: Tuple[str, ...] = ()) -> _ValuesQuery:
+    keys = tuple(entry[0] for schema in schemas for entry in schema) + extra_keys
+    return f"SELECT key, value FROM app_settings WHERE key IN ({', '.join('?' * len(keys))})", keys
+
+
+_LEARNING_VALUES = _values_query(_LEARNING_SCHEMA)
+_MQTT_VALUES = _values_query(_MQTT_SCHEMA, extra_keys=_MQTT_PASSWORD_KEYS)
+_SCRIPT_VALUES = _values_query(_SCRIPT_SCHEMA)
+_LOG_VALUES = _values_query(_LOG_SCHEMA)
+_UI_VALUES = _values_query(
+    _GENERAL_SCHEMA, _MQTT_SCHEMA, _LEARNING_SCHEMA, _SCRIPT_SCHEMA, _LOG_SCHEMA,
+    extra_keys=_MQTT_PASSWORD_KEYS,
+)
+
+
+def _stripped_text(value: Any) -> str:
+    return str(value).strip()
+
+
+def _bool_text(value: Any) -> str:
+    return "1" if value else "0"
+
+
+# Plain update_ui_settings fields and how each value is stored; the MQTT password is handled separately.
+_UI_UPDATE_FIELDS: Tuple[Tuple[str, Callable[[Any], str]], ...] = (
+    ("theme", str),
+    ("language", str),
+    ("hub_is_agent", _bool_text),
+    ("homeassistant_enabled", _bool_text),
+    ("hub_public_url", _stripped_text),
+    ("press_takes_default", str),
+    ("capture_timeout_ms_default", str),
+    ("hold_idle_timeout_ms", str),
+    ("aggregate_round_to_us", str),
+    ("aggregate_min_match_ratio", str),
+    ("mqtt_host", _stripped_text),
+    ("mqtt_port", str),
+    ("mqtt_username", _stripped_text),
+    ("mqtt_instance", _stripped_text),
+    ("script_max_runs", str),
+    ("log_retention_days", str),
+)
+
+
+# Booleans are written as "1"/"0"; the other spellings are still accepted for values stored by older versions.
+_BOOL_TOKENS: Mapping[str, bool] = MappingProxyType({
+    "1": True, "true": True, "yes": True, "y": True, "on": True,
+    "0": False, "false": False, "no": False, "n": False, "off": False,
+})
+
+
+def _coerce(raw: Optional[str], kind: str, default: Any, bounds: Optional[Tuple[Any, Any]]) -> Any:
+    if raw is None:
+        return default
+    if kind == "bool":
+        # Canonical values hit the first lookup without any string normalization.
+        parsed = _BOOL_TOKENS.get(raw)
+        if parsed is None:
+            parsed = _BOOL_TOKENS.get(str(raw).strip().lower())
+        return default if parsed is None else parsed
+    value = str(raw).strip()
+    if kind == "text":
+        return value or default
+
+    try:
+        number = int(value) if kind == "int" else float(value)
+    except Exception:
+        return default
+    if bounds is not None:
+        min_value, max_value = bounds
+        if min_value is not None and number < min_value:
+            return default
+        if max_value is not None and number > max_value:
+            return default
+    return number
+
 
 class Settings(DatabaseBase):
+    def __init__(self, data_dir: str, owner: Optional[DatabaseBase] = None) -> None:
+        super().__init__(data_dir, owner=owner)
+        # Committed key/value pairs, loaded on first read and dropped whenever a write commits.
+        self._cache: Optional[Dict[str, str]] = None
+        self._cache_generation = 0
+        # Coerced getter results built from the cached values, dropped together with them.
+        self._views: Dict[str, Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        # (cipher, ciphertext, nonce, plaintext) of the last MQTT password decryption, replaced as a whole.
+        self._decrypted_password: Optional[Tuple[SettingsCipher, str, str, str]] = None
+
     def _create_schema(self, conn: sqlite3.Connection) -> None:
         conn.executescript(
             """
@@ -15,6 +152,14 @@ class Settings(DatabaseBase):
                 value TEXT NOT NULL,
                 updated_at REAL NOT NULL
             );
+
+            -- Migration: rewrite boolean settings stored as words to the canonical "1"/"0".
+            UPDATE app_settings SET value = '1'
+                WHERE key IN ('hub_is_agent', 'homeassistant_enabled')
+                AND lower(trim(value)) IN ('true', 'yes', 'y', 'on');
+            UPDATE app_settings SET value = '0'
+                WHERE key IN ('hub_is_agent', 'homeassistant_enabled')
+                AND lower(trim(value)) IN ('false', 'no', 'n', 'off');
             """
         )
 
@@ -22,174 +167,141 @@ class Settings(DatabaseBase):
         normalized_key = str(key or "").strip()
         if not normalized_key:
             return default
+        return self._get_fast(normalized_key, default, conn)
 
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute("SELECT value FROM app_settings WHERE key = ?", (normalized_key,)).fetchone()
-            if not row:
-                return default
-            return str(row["value"])
-        finally:
-            if close:
-                c.close()
-
-    def set(self, key: str, value: str, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+    def _get_fast(self, key: str, default: Optional[str] = None, conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
+        # For internal callers passing a known, already clean key literal.
+        if conn is None:
+            return self._cached_values().get(key, default)
+
+        # A caller-supplied connection may hold uncommitted writes, so it bypasses the cache.
+        with self._read_conn(conn) as c:
+            # A plain tuple cursor skips building a sqlite3.Row for a single column.
+            cursor = c.cursor()
+            cursor.row_factory = None
+            row = cursor.execute(_SQL_GET, (key,)).fetchone()
+        if not row:
+            return default
+        return str(row[0])
+
+    def set(
+        self,
+        key: str,
+        value: str,
+        conn: Optional[sqlite3.Connection] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
         normalized_key = str(key or "").strip()
         if not normalized_key:
             raise ValueError("key must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
-            c.execute(
-                "INSERT OR REPLACE INTO app_settings(key, value, updated_at) VALUES(?, ?, ?)",
-                (normalized_key, str(value), now),
-            )
-            c.commit()
-            row = c.execute(
-                "SELECT key, value, updated_at FROM app_settings WHERE key = ?",
-                (normalized_key,),
-            ).fetchone()
-            if not row:
-                raise ValueError("Failed to set setting")
-            return dict(row)
-        finally:
-            if close:
-                c.close()
+        # INSERT OR REPLACE stores exactly these values, so the result is built here instead of echoed by SQLite.
+        row = {"key": normalized_key, "value": str(value), "updated_at": time.time() if now is None else now}
+        with self._write_conn(conn) as c:
+            self._write_setting(c, row["key"], row["value"], row["updated_at"])
+        # Dropped only once the write is committed; a reader reloading earlier would cache the old values again.
+        self._after_commit(self._invalidate_cache)
+        return row
+
+    def _cached_values(self) -> Dict[str, str]:
+        if self._owner._pool.write_block_open():
+            # Reads in a write block go through this thread's writer and may see uncommitted writes that a
+            # rollback still drops, so they bypass the cache and are never stored in it.
+            with self._read_conn(None) as c:
+                return self._fetch_values(c, _SQL_ALL)
+
+        cache = self._cache
+        if cache is not None:
+            return cache
+
+        generation = self._cache_generation
+        with self._read_conn(None) as c:
+            cache = self._fetch_values(c, _SQL_ALL)
+        with self._cache_lock:
+            # A write that committed while loading makes this snapshot stale; keep it for this call only.
+            if generation == self._cache_generation:
+                self._cache = cache
+        return cache
+
+    def _view(
+        self,
+        name: str,
+        conn: Optional[sqlite3.Connection],
+        query: _ValuesQuery,
+        build: Callable[[Dict[str, str]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        if conn is not None or self._owner._pool.write_block_open():
+            return build(self._values(conn, query))
+        view = self._views.get(name)
+        if view is None:
+            values = self._cached_values()
+            view = build(values)
+            with self._cache_lock:
+                # Only keep a view built from the snapshot that is still current.
+                if values is self._cache:
+                    self._views[name] = view
+        # Callers get their own copy so they can decorate it without touching the cached one.
+        return dict(view)
+
+    def _invalidate_cache(self) -> None:
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache = None
+            self._views = {}
+
+    def _write_setting(self, conn: sqlite3.Connection, key: str, value: str, now: float) -> None:
+        # Bare write for callers that batch several settings into their own transaction under one timestamp.
+        conn.execute(
+            _SQL_WRITE,
+            (key, str(value), now),
+        )
+
+    def _write_settings(self, conn: sqlite3.Connection, rows: List[Tuple[str, str, float]]) -> None:
+        # Several (key, value, updated_at) rows in one executemany, without the RETURNING echo of set().
+        if rows:
+            conn.executemany(_SQL_WRITE, rows)
 
     def get_learning_defaults(self) -> Dict[str, Any]:
-        return {
-            "press_takes_default": 5,
-            "capture_timeout_ms_default": 3000,
-            "hold_idle_timeout_ms": 300,
-            "aggregate_round_to_us": 10,
-            "aggregate_min_match_ratio": 0.6,
-        }
+        return dict(_LEARNING_DEFAULTS)
 
     def get_learning_settings(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        
-        learning_defaults = self.get_learning_defaults()
-        return {
-            "press_takes_default": self._read_int_setting(
-                "press_takes_default",
-                default=learning_defaults["press_takes_default"],
-                min_value=1,
-                max_value=50,
-                conn=conn,
-            ),
-            "capture_timeout_ms_default": self._read_int_setting(
-                "capture_timeout_ms_default",
-                default=learning_defaults["capture_timeout_ms_default"],
-                min_value=100,
-                max_value=60000,
-                conn=conn,
-            ),
-            "hold_idle_timeout_ms": self._read_int_setting(
-                "hold_idle_timeout_ms",
-                default=learning_defaults["hold_idle_timeout_ms"],
-                min_value=50,
-                max_value=2000,
-                conn=conn,
-            ),
-            "aggregate_round_to_us": self._read_int_setting(
-                "aggregate_round_to_us",
-                default=learning_defaults["aggregate_round_to_us"],
-                min_value=1,
-                max_value=1000,
-                conn=conn,
-            ),
-            "aggregate_min_match_ratio": self._read_float_setting(
-                "aggregate_min_match_ratio",
-                default=learning_defaults["aggregate_min_match_ratio"],
-                min_value=0.1,
-                max_value=1.0,
-                conn=conn,
-            ),
-        }
+        return self._view("learning", conn, _LEARNING_VALUES, self._learning_settings)
 
     def get_mqtt_settings(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        mqtt_instance = self._read_text_setting("mqtt_instance", default="", conn=conn)
-        return {
-            "mqtt_host": self._read_text_setting("mqtt_host", default="", conn=conn),
-            "mqtt_port": self._read_int_setting(
-                "mqtt_port",
-                default=1883,
-                min_value=1,
-                max_value=65535,
-                conn=conn,
-            ),
-            "mqtt_username": self._read_text_setting("mqtt_username", default="", conn=conn),
-            "mqtt_instance": mqtt_instance,
-            "mqtt_base_topic": self._build_mqtt_base_topic(mqtt_instance),
-            "mqtt_password_set": self._has_mqtt_password(conn=conn),
-        }
+        return self._view("mqtt", conn, _MQTT_VALUES, self._mqtt_settings)
 
     def get_script_settings(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        return {
-            "script_max_runs": self._read_int_setting(
-                "script_max_runs",
-                default=10,
-                min_value=1,
-                max_value=100,
-                conn=conn,
-            ),
-        }
+        return self._view("script", conn, _SCRIPT_VALUES, self._script_settings)
 
     def get_log_settings(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        return {
-            "log_retention_days": self._read_int_setting(
-                "log_retention_days",
-                default=7,
-                min_value=1,
-                max_value=365,
-                conn=conn,
-            ),
-        }
+        return self._view("log", conn, _LOG_VALUES, self._log_settings)
 
     def update_log_settings(
         self,
         log_retention_days: Optional[int] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
+        with self._write_conn(conn) as c:
             if log_retention_days is not None:
-                self.set("log_retention_days", str(log_retention_days), conn=c)
-            return self.get_log_settings(conn=c)
-        finally:
-            if close:
-                c.close()
+                self._write_setting(c, "log_retention_days", str(log_retention_days), time.time())
+            settings = self.get_log_settings(conn=c)
+        self._after_commit(self._invalidate_cache)
+        return settings
 
     def get_ui_settings(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        settings = {
-            "theme": self._read_text_setting("theme", default="system", conn=conn),
-            "language": self._read_text_setting("language", default="en", conn=conn),
-            "hub_is_agent": self._read_bool_setting("hub_is_agent", default=True, conn=conn),
-            "homeassistant_enabled": self._read_bool_setting("homeassistant_enabled", default=False, conn=conn),
-            "hub_public_url": self._read_text_setting("hub_public_url", default="", conn=conn),
-        }
-        settings.update(self.get_mqtt_settings(conn=conn))
-        settings.update(self.get_learning_settings(conn=conn))
-        settings.update(self.get_script_settings(conn=conn))
-        settings.update(self.get_log_settings(conn=conn))
-        return settings
+        return self._view("ui", conn, _UI_VALUES, self._ui_settings)
 
     def get_runtime_settings(self, settings_cipher: SettingsCipher, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
-        settings = self.get_ui_settings(conn=conn)
+        values = self._values(conn, _UI_VALUES)
+        settings = self._ui_settings(values)
         password = ""
 
         if settings["mqtt_password_set"]:
             if not settings_cipher.is_configured:
                 raise ValueError("settings_master_key_missing")
 
-            ciphertext = self.get("mqtt_password_ciphertext", default="", conn=conn) or ""
-            nonce = self.get("mqtt_password_nonce", default="", conn=conn) or ""
-            if not ciphertext or not nonce:
-                raise ValueError("mqtt_password_decrypt_failed")
-            try:
-                password = settings_cipher.decrypt(ciphertext, nonce)
-            except Exception as exc:
-                raise ValueError("mqtt_password_decrypt_failed") from exc
+            ciphertext, nonce = self._get_mqtt_password_blob(values)
+            password = self._decrypt_mqtt_password(settings_cipher, ciphertext, nonce)
 
         return {
             **settings,
@@ -218,148 +330,123 @@ class Settings(DatabaseBase):
         settings_cipher: Optional[SettingsCipher] = None,
         conn: Optional[sqlite3.Connection] = None,
     ) -> Dict[str, Any]:
-        c, close = self._use_conn(conn)
-        try:
-            if theme is not None:
-                self.set("theme", str(theme), conn=c)
-            if language is not None:
-                self.set("language", str(language), conn=c)
-            if hub_is_agent is not None:
-                self.set("hub_is_agent", str(bool(hub_is_agent)).lower(), conn=c)
-            if homeassistant_enabled is not None:
-                self.set("homeassistant_enabled", str(bool(homeassistant_enabled)).lower(), conn=c)
-            if hub_public_url is not None:
-                self.set("hub_public_url", str(hub_public_url).strip(), conn=c)
-
-            if press_takes_default is not None:
-                self.set("press_takes_default", str(press_takes_default), conn=c)
-            if capture_timeout_ms_default is not None:
-                self.set("capture_timeout_ms_default", str(capture_timeout_ms_default), conn=c)
-            if hold_idle_timeout_ms is not None:
-                self.set("hold_idle_timeout_ms", str(hold_idle_timeout_ms), conn=c)
-            if aggregate_round_to_us is not None:
-                self.set("aggregate_round_to_us", str(aggregate_round_to_us), conn=c)
-            if aggregate_min_match_ratio is not None:
-                self.set("aggregate_min_match_ratio", str(aggregate_min_match_ratio), conn=c)
-
-            if mqtt_host is not None:
-                self.set("mqtt_host", str(mqtt_host).strip(), conn=c)
-            if mqtt_port is not None:
-                self.set("mqtt_port", str(mqtt_port), conn=c)
-            if mqtt_username is not None:
-                self.set("mqtt_username", str(mqtt_username).strip(), conn=c)
-            if mqtt_instance is not None:
-                self.set("mqtt_instance", str(mqtt_instance).strip(), conn=c)
+        now = time.time()
+        # Plain fields are written in one executemany; the MQTT password has its own encryption path.
+        provided = {
+            "theme": theme,
+            "language": language,
+            "hub_is_agent": hub_is_agent,
+            "homeassistant_enabled": homeassistant_enabled,
+            "hub_public_url": hub_public_url,
+            "press_takes_default": press_takes_default,
+            "capture_timeout_ms_default": capture_timeout_ms_default,
+            "hold_idle_timeout_ms": hold_idle_timeout_ms,
+            "aggregate_round_to_us": aggregate_round_to_us,
+            "aggregate_min_match_ratio": aggregate_min_match_ratio,
+            "mqtt_host": mqtt_host,
+            "mqtt_port": mqtt_port,
+            "mqtt_username": mqtt_username,
+            "mqtt_instance": mqtt_instance,
+            "script_max_runs": script_max_runs,
+            "log_retention_days": log_retention_days,
+        }
+        rows: List[Tuple[str, str, float]] = [
+            (key, to_text(provided[key]), now)
+            for key, to_text in _UI_UPDATE_FIELDS
+            if provided[key] is not None
+        ]
+
+        with self._write_conn(conn) as c:
+            self._write_settings(c, rows)
             if mqtt_password is not None:
                 self._update_mqtt_password(
                     mqtt_password=str(mqtt_password),
                     settings_cipher=settings_cipher,
                     conn=c,
+                    now=now,
                 )
-            if script_max_runs is not None:
-                self.set("script_max_runs", str(script_max_runs), conn=c)
-            if log_retention_days is not None:
-                self.set("log_retention_days", str(log_retention_days), conn=c)
 
-            return self.get_ui_settings(conn=c)
-        finally:
-            if close:
-                c.close()
+            settings = self.get_ui_settings(conn=c)
+        self._after_commit(self._invalidate_cache)
+        return settings
 
-    def _read_int_setting(
-        self,
-        key: str,
-        default: int,
-        min_value: Optional[int] = None,
-        max_value: Optional[int] = None,
-        conn: Optional[sqlite3.Connection] = None,
-    ) -> int:
-        raw = self.get(key, default=None, conn=conn)
-        if raw is None:
-            return default
-        try:
-            value = int(str(raw).strip())
-        except Exception:
-            return default
-        if min_value is not None and value < min_value:
-            return default
-        if max_value is not None and value > max_value:
-            return default
-        return value
+    def _values(self, conn: Optional[sqlite3.Connection], query: _ValuesQuery) -> Dict[str, str]:
+        if conn is None:
+            return self._cached_values()
+        # A caller-supplied connection may hold uncommitted writes, so it bypasses the cache and reads only the
+        # keys the getter needs, all in one statement.
+        sql, keys = query
+        return self._fetch_values(conn, sql, keys)
 
-    def _read_bool_setting(
-        self,
-        key: str,
-        default: bool,
-        conn: Optional[sqlite3.Connection] = None,
-    ) -> bool:
-        raw = self.get(key, default=None, conn=conn)
-        if raw is None:
-            return default
-        value = str(raw).strip().lower()
-        if value in ("1", "true", "yes", "y", "on"):
-            return True
-        if value in ("0", "false", "no", "n", "off"):
-            return False
-        return default
+    def _fetch_values(self, conn: sqlite3.Connection, sql: str, params: Tuple[str, ...] = ()) -> Dict[str, str]:
+        # Key/value pairs are unpacked positionally, so a tuple cursor avoids a sqlite3.Row per setting.
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        # Interned keys are the same objects as the key literals in this module, so lookups match by identity.
+        return {sys.intern(str(key)): str(value) for key, value in cursor.execute(sql, params)}
 
-    def _read_text_setting(
-        self,
-        key: str,
-        default: str,
-        conn: Optional[sqlite3.Connection] = None,
-    ) -> str:
-        raw = self.get(key, default=None, conn=conn)
-        if raw is None:
-            return default
-        value = str(raw).strip()
-        if not value:
-            return default
-        return value
+    def _read_schema(self, schema: Tuple[_SchemaEntry, ...], values: Dict[str, str]) -> Dict[str, Any]:
+        return {key: _coerce(values.get(key), kind, default, bounds) for key, kind, default, bounds in schema}
 
-    def _read_float_setting(
-        self,
-        key: str,
-        default: float,
-        min_value: Optional[float] = None,
-        max_value: Optional[float] = None,
-        conn: Optional[sqlite3.Connection] = None,
-    ) -> float:
-        raw = self.get(key, default=None, conn=conn)
-        if raw is None:
-            return default
-        try:
-            value = float(str(raw).strip())
-        except Exception:
-            return default
-        if min_value is not None and value < min_value:
-            return default
-        if max_value is not None and value > max_value:
-            return default
-        return value
+    def _learning_settings(self, values: Dict[str, str]) -> Dict[str, Any]:
+        return self._read_schema(_LEARNING_SCHEMA, values)
+
+    def _script_settings(self, values: Dict[str, str]) -> Dict[str, Any]:
+        return self._read_schema(_SCRIPT_SCHEMA, values)
+
+    def _log_settings(self, values: Dict[str, str]) -> Dict[str, Any]:
+        return self._read_schema(_LOG_SCHEMA, values)
+
+    def _ui_settings(self, values: Dict[str, str]) -> Dict[str, Any]:
+        settings = self._read_schema(_GENERAL_SCHEMA, values)
+        settings.update(self._mqtt_settings(values))
+        settings.update(self._learning_settings(values))
+        settings.update(self._script_settings(values))
+        settings.update(self._log_settings(values))
+        return settings
+
+    def _mqtt_settings(self, values: Dict[str, str]) -> Dict[str, Any]:
+        settings = self._read_schema(_MQTT_SCHEMA, values)
+        settings["mqtt_base_topic"] = self._build_mqtt_base_topic(settings["mqtt_instance"])
+        ciphertext, nonce = self._get_mqtt_password_blob(values)
+        settings["mqtt_password_set"] = bool(ciphertext and nonce)
+        return settings
 
-    def _has_mqtt_password(self, conn: Optional[sqlite3.Connection] = None) -> bool:
-        ciphertext = self.get("mqtt_password_ciphertext", default="", conn=conn) or ""
-        nonce = self.get("mqtt_password_nonce", default="", conn=conn) or ""
-        return bool(ciphertext and nonce)
+    def _get_mqtt_password_blob(self, values: Dict[str, str]) -> Tuple[str, str]:
+        ciphertext_key, nonce_key = _MQTT_PASSWORD_KEYS
+        return values.get(ciphertext_key) or "", values.get(nonce_key) or ""
+
+    def _decrypt_mqtt_password(self, settings_cipher: SettingsCipher, ciphertext: str, nonce: str) -> str:
+        # Runtime settings are reloaded often while the stored password rarely changes, so the last
+        # decryption is reused as long as cipher and blob are the same.
+        memo = self._decrypted_password
+        if memo is not None and memo[0] is settings_cipher and memo[1] == ciphertext and memo[2] == nonce:
+            return memo[3]
+        try:
+            password = settings_cipher.decrypt(ciphertext, nonce)
+        except Exception as exc:
+            raise ValueError("mqtt_password_decrypt_failed") from exc
+        self._decrypted_password = (settings_cipher, ciphertext, nonce, password)
+        return password
 
     def _update_mqtt_password(
         self,
         mqtt_password: str,
         settings_cipher: Optional[SettingsCipher],
-        conn: Optional[sqlite3.Connection] = None,
+        conn: sqlite3.Connection,
+        now: float,
     ) -> None:
+        self._decrypted_password = None
+        ciphertext_key, nonce_key = _MQTT_PASSWORD_KEYS
         if mqtt_password == "":
-            self.set("mqtt_password_ciphertext", "", conn=conn)
-            self.set("mqtt_password_nonce", "", conn=conn)
+            self._write_settings(conn, [(ciphertext_key, "", now), (nonce_key, "", now)])
             return
 
         if settings_cipher is None or not settings_cipher.is_configured:
             raise ValueError("settings_master_key_missing")
 
         ciphertext, nonce = settings_cipher.encrypt(mqtt_password)
-        self.set("mqtt_password_ciphertext", ciphertext, conn=conn)
-        self.set("mqtt_password_nonce", nonce, conn=conn)
+        self._write_settings(conn, [(ciphertext_key, str(ciphertext), now), (nonce_key, str(nonce), now)])
 
     def _build_mqtt_base_topic(self, instance: str) -> str:
         normalized_instance = str(instance or "").strip().strip("/")
@@ -1,9 +1,58 @@
 import sqlite3
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from database.database_base import DatabaseBase
 
+# Table column order; results are read and returned with exactly these keys.
+_COLUMNS = (
+    "button_id",
+    "encoding",
+    "press_initial",
+    "press_repeat",
+    "hold_initial",
+    "hold_repeat",
+    "hold_gap_us",
+    "sample_count_press",
+    "sample_count_hold",
+    "quality_score_press",
+    "quality_score_hold",
+    "protocol",
+    "address",
+    "command_hex",
+    "decode_confidence",
+    "created_at",
+    "updated_at",
+)
+_COLUMN_LIST = ", ".join(_COLUMNS)
+
+# The upserts insert a fresh row or rewrite only their own columns of an existing one; hold and decoder
+# fields as well as created_at survive the update. The bound timestamp (?7 / ?5) sets both created_at and
+# updated_at on insert.
+_SQL_UPSERT_PRESS = (
+    f"INSERT INTO button_signals({_COLUMN_LIST}) "
+    "VALUES(?1, ?2, ?3, ?4, NULL, NULL, NULL, ?5, 0, ?6, NULL, NULL, NULL, NULL, NULL, ?7, ?7) "
+    "ON CONFLICT(button_id) DO UPDATE SET "
+    "encoding = excluded.encoding, press_initial = excluded.press_initial, press_repeat = excluded.press_repeat, "
+    "sample_count_press = excluded.sample_count_press, quality_score_press = excluded.quality_score_press, "
+    "updated_at = excluded.updated_at "
+    f"RETURNING {_COLUMN_LIST}"
+)
+_SQL_UPSERT_PROTOCOL = (
+    f"INSERT INTO button_signals({_COLUMN_LIST}) "
+    "VALUES(?1, 'protocol', NULL, NULL, NULL, NULL, NULL, 0, 0, NULL, NULL, ?2, ?3, ?4, NULL, ?5, ?5) "
+    "ON CONFLICT(button_id) DO UPDATE SET "
+    "encoding = 'protocol', press_initial = NULL, press_repeat = NULL, sample_count_press = 0, "
+    "quality_score_press = NULL, protocol = excluded.protocol, address = excluded.address, "
+    "command_hex = excluded.command_hex, updated_at = excluded.updated_at "
+    f"RETURNING {_COLUMN_LIST}"
+)
+_SQL_UPDATE_HOLD = (
+    "UPDATE button_signals SET hold_initial = ?, hold_repeat = ?, hold_gap_us = ?, sample_count_hold = ?, "
+    f"quality_score_hold = ?, updated_at = ? WHERE button_id = ? RETURNING {_COLUMN_LIST}"
+)
+_SQL_GET = f"SELECT {_COLUMN_LIST} FROM button_signals WHERE button_id = ?"
+
 
 class Signals(DatabaseBase):
 
@@ -45,16 +94,8 @@ class Signals(DatabaseBase):
     # Signals
     # -----------------------------
     def list_by_button(self, button_id: int, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
-        c, close = self._use_conn(conn)
-        try:
-            row = c.execute(
-                "SELECT * FROM button_signals WHERE button_id = ?",
-                (button_id,),
-            ).fetchone()
-            return dict(row) if row else None
-        finally:
-            if close:
-                c.close()
+        with self._read_conn(conn) as c:
+            return self._fetch_signal(c, _SQL_GET, (button_id,))
 
     def upsert_press(
         self,
@@ -72,63 +113,15 @@ class Signals(DatabaseBase):
         if sample_count_press <= 0:
             raise ValueError("sample_count_press must be > 0")
 
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
-            existing = c.execute(
-                "SELECT button_id FROM button_signals WHERE button_id = ?",
-                (button_id,),
-            ).fetchone()
-
-            if existing:
-                c.execute(
-                    """
-                    UPDATE button_signals
-                    SET encoding = ?,
-                        press_initial = ?,
-                        press_repeat = ?,
-                        sample_count_press = ?,
-                        quality_score_press = ?,
-                        updated_at = ?
-                    WHERE button_id = ?
-                    """,
-                    (encoding, press_initial, press_repeat, sample_count_press, quality_score_press, now, button_id),
-                )
-            else:
-                c.execute(
-                    """
-                    INSERT INTO button_signals(
-                        button_id,
-                        encoding,
-                        press_initial,
-                        press_repeat,
-                        hold_initial,
-                        hold_repeat,
-                        hold_gap_us,
-                        sample_count_press,
-                        sample_count_hold,
-                        quality_score_press,
-                        quality_score_hold,
-                        protocol,
-                        address,
-                        command_hex,
-                        decode_confidence,
-                        created_at,
-                        updated_at
-                    )
-                    VALUES(?, ?, ?, ?, NULL, NULL, NULL, ?, 0, ?, NULL, NULL, NULL, NULL, NULL, ?, ?)
-                    """,
-                    (button_id, encoding, press_initial, press_repeat, sample_count_press, quality_score_press, now, now),
-                )
-
-            c.commit()
-            out = c.execute("SELECT * FROM button_signals WHERE button_id = ?", (button_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            out = self._fetch_signal(
+                c,
+                _SQL_UPSERT_PRESS,
+                (button_id, encoding, press_initial, press_repeat, sample_count_press, quality_score_press, time.time()),
+            )
             if not out:
                 raise ValueError("Failed to upsert press signal")
-            return dict(out)
-        finally:
-            if close:
-                c.close()
+            return out
 
     def upsert_protocol(
         self,
@@ -145,66 +138,15 @@ class Signals(DatabaseBase):
         if not protocol or not address or not command_hex:
             raise ValueError("protocol, address, and command_hex must not be empty")
 
-        c, close = self._use_conn(conn)
-        try:
-            now = time.time()
-            existing = c.execute(
-                "SELECT button_id FROM button_signals WHERE button_id = ?",
-                (button_id,),
-            ).fetchone()
-
-            if existing:
-                c.execute(
-                    """
-                    UPDATE button_signals
-                    SET encoding = 'protocol',
-                        press_initial = NULL,
-                        press_repeat = NULL,
-                        sample_count_press = 0,
-                        quality_score_press = NULL,
-                        protocol = ?,
-                        address = ?,
-                        command_hex = ?,
-                        updated_at = ?
-                    WHERE button_id = ?
-                    """,
-                    (protocol, address, command_hex, now, button_id),
-                )
-            else:
-                c.execute(
-                    """
-                    INSERT INTO button_signals(
-                        button_id,
-                        encoding,
-                        press_initial,
-                        press_repeat,
-                        hold_initial,
-                        hold_repeat,
-                        hold_gap_us,
-                        sample_count_press,
-                        sample_count_hold,
-                        quality_score_press,
-                        quality_score_hold,
-                        protocol,
-                        address,
-                        command_hex,
-                        decode_confidence,
-                        created_at,
-                        updated_at
-                    )
-                    VALUES(?, 'protocol', NULL, NULL, NULL, NULL, NULL, 0, 0, NULL, NULL, ?, ?, ?, NULL, ?, ?)
-                    """,
-                    (button_id, protocol, address, command_hex, now, now),
-                )
-
-            c.commit()
-            out = c.execute("SELECT * FROM button_signals WHERE button_id = ?", (button_id,)).fetchone()
+        with self._write_conn(conn) as c:
+            out = self._fetch_signal(
+                c,
+                _SQL_UPSERT_PROTOCOL,
+                (button_id, protocol, address, command_hex, time.time()),
+            )
             if not out:
                 raise ValueError("Failed to upsert protocol signal")
-            return dict(out)
-        finally:
-            if close:
-                c.close()
+            return out
 
     def update_hold(
         self,
@@ -222,35 +164,16 @@ class Signals(DatabaseBase):
         if sample_count_hold <= 0:
             raise ValueError("sample_count_hold must be > 0")
 
-        c, close = self._use_conn(conn)
-        try:
-            existing = c.execute(
-                "SELECT button_id FROM button_signals WHERE button_id = ?",
-                (button_id,),
-            ).fetchone()
-            if not existing:
-                raise ValueError("Press signal must be captured before hold")
-
-            now = time.time()
-            c.execute(
-                """
-                UPDATE button_signals
-                SET hold_initial = ?,
-                    hold_repeat = ?,
-                    hold_gap_us = ?,
-                    sample_count_hold = ?,
-                    quality_score_hold = ?,
-                    updated_at = ?
-                WHERE button_id = ?
-                """,
-                (hold_initial, hold_repeat, hold_gap_us, sample_count_hold, quality_score_hold, now, button_id),
+        with self._write_conn(conn) as c:
+            # RETURNING yields no row when there is no press signal yet, which doubles as the existence check.
+            out = self._fetch_signal(
+                c,
+                _SQL_UPDATE_HOLD,
+                (hold_initial, hold_repeat, hold_gap_us, sample_count_hold, quality_score_hold, time.time(), button_id),
             )
-            c.commit()
-
-            out = c.execute("SELECT * FROM button_signals WHERE button_id = ?", (button_id,)).fetchone()
             if not out:
-                raise ValueError("Unknown button_id")
-            return dict(out)
-        finally:
-            if close:
-                c.close()
+                raise ValueError("Press signal must be captured before hold")
+            return out
+
+    def _fetch_signal(self, conn: sqlite3.Connection, sql: str, params: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        return self._dict_cursor(conn, _COLUMNS).execute(sql, params).fetchone()
@@ -1,9 +1,8 @@
-
-import os
 import subprocess
-import tempfile
 from typing import List, Optional, Tuple
 
+from .ir_receive_stream import IrReceiveStream
+
 
 class IrCtlEngine:
     def __init__(self, ir_rx_device: str, ir_tx_device: str, wideband_default: bool = False) -> None:
@@ -17,14 +16,13 @@ class IrCtlEngine:
 
         use_wideband = self._wideband_default if wideband is None else bool(wideband)
 
-        with tempfile.NamedTemporaryFile(prefix="ir_rx_", delete=False) as tmp:
-            path = tmp.name
-
+        # Without a file argument ir-ctl writes the received message to stdout, so it comes back through the
+        # pipe instead of a temporary file that has to be created, read and removed for every frame.
         cmd: List[str] = [
             "ir-ctl",
             "-d",
             self._ir_rx_device,
-            f"--receive={path}",
+            "--receive",
             "--one-shot",
         ]
         if use_wideband:
@@ -35,30 +33,34 @@ class IrCtlEngine:
                 cmd,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
                 timeout=max(timeout_ms / 1000.0, 0.1),
             )
         except subprocess.TimeoutExpired:
-            self._safe_remove(path)
             raise TimeoutError("No IR message received within timeout") from None
 
-        stdout = (proc.stdout or "").strip()
+        raw = (proc.stdout or "").strip()
         stderr = (proc.stderr or "").strip()
 
-        raw = ""
-        try:
-            raw = self._read_all_text(path)
-        finally:
-            self._safe_remove(path)
-
         if proc.returncode != 0:
-            raise ValueError(f"ir-ctl receive failed (code={proc.returncode}): {stderr or stdout}")
+            raise ValueError(f"ir-ctl receive failed (code={proc.returncode}): {stderr or raw}")
 
         if not raw:
             raise TimeoutError("No IR message received")
 
-        return raw, stdout, stderr
+        # The message is ir-ctl's whole stdout, so it doubles as the stdout shown in the learning debug log.
+        return raw, raw, stderr
 
 
+    def open_receive_stream(self, wideband: Optional[bool] = None) -> IrReceiveStream:
+        """Start a receiver that stays open until closed, for reading several messages in a row."""
+        use_wideband = self._wideband_default if wideband is None else bool(wideband)
+        cmd: List[str] = ["ir-ctl", "-d", self._ir_rx_device, "--receive"]
+        if use_wideband:
+            cmd.append("--wideband")
+        return IrReceiveStream(cmd)
+
     def send_protocol(
         self,
         ir_ctl_protocol: str,
@@ -88,6 +90,21 @@ class IrCtlEngine:
 
         return stdout, stderr
 
+    def send_pulse_space_stream(
+        self,
+        text: str,
+        carrier_hz: Optional[int] = None,
+        duty_cycle: Optional[int] = None,
+        emitters: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """Send one pulse/space frame that ir-ctl reads from its stdin instead of a file."""
+        if not text.strip():
+            raise ValueError("text must not be empty")
+
+        cmd = self._send_cmd(None, carrier_hz, duty_cycle, emitters)
+        cmd.append("--send=/dev/stdin")
+        return self._run_send(cmd, text)
+
     def send_pulse_space_files(
         self,
         file_paths: List[str],
@@ -99,6 +116,18 @@ class IrCtlEngine:
         if not file_paths:
             raise ValueError("file_paths must not be empty")
 
+        cmd = self._send_cmd(gap_us, carrier_hz, duty_cycle, emitters)
+        for p in file_paths:
+            cmd.append(f"--send={p}")
+        return self._run_send(cmd, None)
+
+    def _send_cmd(
+        self,
+        gap_us: Optional[int],
+        carrier_hz: Optional[int],
+        duty_cycle: Optional[int],
+        emitters: Optional[str],
+    ) -> List[str]:
         cmd: List[str] = ["ir-ctl", "-d", self._ir_tx_device]
 
         if gap_us is not None and gap_us > 0:
@@ -109,11 +138,10 @@ class IrCtlEngine:
             cmd.append(f"--duty-cycle={int(duty_cycle)}")
         if emitters:
             cmd.append(f"--emitters={emitters}")
+        return cmd
 
-        for p in file_paths:
-            cmd.append(f"--send={p}")
-
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+    def _run_send(self, cmd: List[str], stdin_text: Optional[str]) -> Tuple[str, str]:
+        proc = subprocess.run(cmd, input=stdin_text, capture_output=True, text=True)
         stdout = (proc.stdout or "").strip()
         stderr = (proc.stderr or "").strip()
 
@@ -121,19 +149,3 @@ class IrCtlEngine:
             raise RuntimeError(f"ir-ctl send failed (code={proc.returncode}): {stderr or stdout}")
 
         return stdout, stderr
-
-    def _read_all_text(self, path: str) -> str:
-        try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                content = f.read()
-        except FileNotFoundError:
-            return ""
-        return (content or "").strip()
-
-    def _safe_remove(self, path: str) -> None:
-        try:
-            if os.path.exists(path):
-                os.remove(path)
-        except Exception:
-            pass
-        
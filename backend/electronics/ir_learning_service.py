@@ -14,6 +14,10 @@ from .status_communication import StatusCommunication
 
 
 class IrLearningService:
+    AUTO_BUTTON_NAME_PATTERN = re.compile(r"^BTN_(\d{4})$")
+    # Debug log entries trigger at most one status broadcast per interval; higher levels always broadcast.
+    DEBUG_BROADCAST_INTERVAL_S = 0.05
+
     def __init__(
         self,
         database: Database,
@@ -41,6 +45,7 @@ class IrLearningService:
 
         self._lock = threading.Lock()
         self._session: Optional[LearningSession] = None
+        self._last_broadcast_ts = 0.0
 
     @property
     def is_learning(self) -> bool:
@@ -229,11 +234,14 @@ class IrLearningService:
             raw_lines.append(raw)
             frames.append(pulses)
 
+            # Except after the last take, the "Waiting" entry of the next take follows at once and carries
+            # this entry in its broadcast.
             self._log(
                 session,
                 "info",
                 "Captured press take",
                 {"take": i + 1, "pulses": len(pulses), "tail_gap_us": tail_gap_us},
+                broadcast=i == takes - 1,
             )
 
         aggregated, used_indices, score = self._aggregator.aggregate(
@@ -253,18 +261,20 @@ class IrLearningService:
 
         button_id = int(button["id"])
 
-        if self._debug:
-            for take_idx, raw in enumerate(raw_lines):
-                self._db.captures.create(button_id=button_id, mode="press", take_index=take_idx, raw_text=raw)
-
-        signals = self._db.signals.upsert_press(
-            button_id=button_id,
-            press_initial=press_initial,
-            press_repeat=None,
-            sample_count_press=len(used_indices),
-            quality_score_press=score,
-            encoding="raw",
-        )
+        # Debug captures and the signal share one transaction so they commit together.
+        with self._db.transaction() as conn:
+            if self._debug:
+                self._db.captures.create_many(button_id=button_id, mode="press", takes=enumerate(raw_lines), conn=conn)
+
+            signals = self._db.signals.upsert_press(
+                button_id=button_id,
+                press_initial=press_initial,
+                press_repeat=None,
+                sample_count_press=len(used_indices),
+                quality_score_press=score,
+                encoding="raw",
+                conn=conn,
+            )
 
         session.last_button_id = button_id
         session.last_button_name = str(button["name"])
@@ -383,7 +393,7 @@ class IrLearningService:
         tail_gaps: List[Optional[int]] = []
         frame_end_times: List[float] = []
 
-        deadline = time.time() + (timeout_ms / 1000.0)
+        deadline = time.monotonic() + (timeout_ms / 1000.0)
 
         # First message (initial)
         self._log(session, "info", "Waiting for IR hold (initial frame)", {"timeout_ms": timeout_ms})
@@ -403,7 +413,7 @@ class IrLearningService:
 
         # Subsequent messages (repeats) until idle.
         while True:
-            remaining_ms = int(max(0.0, (deadline - time.time()) * 1000.0))
+            remaining_ms = int(max(0.0, (deadline - time.monotonic()) * 1000.0))
             if remaining_ms <= 0:
                 break
 
@@ -461,18 +471,20 @@ class IrLearningService:
         if hold_gap_us is None:
             raise ValueError("Failed to infer hold gap from capture. Hold longer and try again.")
 
-        if self._debug:
-            for idx, raw in enumerate(frames_raw):
-                self._db.captures.create(button_id=button_id, mode="hold", take_index=idx, raw_text=raw)
-
-        updated = self._db.signals.update_hold(
-            button_id=button_id,
-            hold_initial=hold_initial_text,
-            hold_repeat=hold_repeat_text,
-            hold_gap_us=hold_gap_us,
-            sample_count_hold=len(frames),
-            quality_score_hold=repeat_score,
-        )
+        # Debug captures and the signal share one transaction so they commit together.
+        with self._db.transaction() as conn:
+            if self._debug:
+                self._db.captures.create_many(button_id=button_id, mode="hold", takes=enumerate(frames_raw), conn=conn)
+
+            updated = self._db.signals.update_hold(
+                button_id=button_id,
+                hold_initial=hold_initial_text,
+                hold_repeat=hold_repeat_text,
+                hold_gap_us=hold_gap_us,
+                sample_count_hold=len(frames),
+                quality_score_hold=repeat_score,
+                conn=conn,
+            )
 
         session.last_button_id = button_id
         session.last_button_name = str(button["name"])
@@ -513,26 +525,39 @@ class IrLearningService:
     def _compute_next_button_index(self, remote_id: int) -> int:
         buttons = self._db.buttons.list(remote_id)
         best = 0
+        pattern = self.AUTO_BUTTON_NAME_PATTERN
         for b in buttons:
-            name = str(b.get("name") or "")
-            m = re.match(r"^BTN_(\d{4})$", name)
-            if not m:
-                continue
-            try:
+            m = pattern.match(str(b.get("name") or ""))
+            # The group is always four digits, so int() cannot fail.
+            if m:
                 best = max(best, int(m.group(1)))
-            except Exception:
-                pass
         return best + 1 if best > 0 else 1
 
-    def _log(self, session: LearningSession, level: str, message: str, data: Optional[Dict[str, Any]] = None) -> None:
-        session.logs.append(LogEntry(timestamp=time.time(), level=level, message=message, data=data))
+    def _log(
+        self,
+        session: LearningSession,
+        level: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None,
+        broadcast: bool = True,
+    ) -> None:
+        session.add_log(LogEntry(timestamp=time.time(), level=level, message=message, data=data))
         # Only broadcast when this is the active session to avoid stale updates.
-        if self._session is session:
-            self._publish_status(self._session_to_dict(session, active=True))
+        if not broadcast or self._session is not session:
+            return
+        if level == "debug":
+            # Skipped debug entries stay in the session log and go out with the next broadcast.
+            with self._lock:
+                if time.monotonic() - self._last_broadcast_ts < self.DEBUG_BROADCAST_INTERVAL_S:
+                    return
+        self._publish_status(self._session_to_dict(session, active=True))
 
     def _publish_status(self, payload: Dict[str, Any]) -> None:
-        if self._status_comm:
-            self._status_comm.broadcast(payload)
+        if not self._status_comm:
+            return
+        with self._lock:
+            self._last_broadcast_ts = time.monotonic()
+        self._status_comm.broadcast(payload)
 
     def _session_to_dict(self, session: LearningSession, active: bool) -> Dict[str, Any]:
         return {
@@ -545,21 +570,16 @@ class IrLearningService:
             "last_button_id": session.last_button_id,
             "last_button_name": session.last_button_name,
             "next_button_index": session.next_button_index,
-            "logs": [
-                {
-                    "timestamp": e.timestamp,
-                    "level": e.level,
-                    "message": e.message,
-                    "data": e.data,
-                }
-                for e in session.logs
-            ],
+            # A shallow copy: the payload is sent later on the event loop while the session keeps logging.
+            "logs": list(session.logs),
         }
 
     def _median_int(self, values: List[int]) -> int:
-        if not values:
+        return self._median_sorted_int(sorted(int(v) for v in values))
+
+    def _median_sorted_int(self, values_sorted: List[int]) -> int:
+        if not values_sorted:
             return 0
-        values_sorted = sorted(int(v) for v in values)
         n = len(values_sorted)
         mid = n // 2
         if n % 2 == 1:
@@ -574,9 +594,11 @@ class IrLearningService:
         if len(repeat_gaps) == 2:
             return int(min(repeat_gaps))
 
-        # Drop the largest gap to avoid the release gap skewing the repeat cadence.
-        trimmed = sorted(int(v) for v in repeat_gaps)[:-1]
-        return self._median_int(trimmed)
+        # Drop the largest gap to avoid the release gap skewing the repeat cadence. The list is sorted once
+        # here and the median is taken from it directly.
+        ordered = sorted(int(v) for v in repeat_gaps)
+        ordered.pop()
+        return self._median_sorted_int(ordered)
 
     def _resolve_hold_gap_candidates(
         self,
@@ -594,11 +616,14 @@ class IrLearningService:
         if len(frames) < 2 or len(frame_end_times) < 2:
             return []
 
-        frame_durations = [sum(abs(int(v)) for v in frame) for frame in frames]
+        # The first frame only anchors the timeline, so its duration is never needed. Pulses are parsed ints,
+        # which lets map(abs, ...) sum them without a per-element int() call.
         timestamp_candidates: List[int] = []
-        for idx in range(1, len(frames)):
-            delta_us = int(round((frame_end_times[idx] - frame_end_times[idx - 1]) * 1_000_000))
-            gap_us = delta_us - int(frame_durations[idx])
+        previous_end = frame_end_times[0]
+        for frame, end_time in zip(frames[1:], frame_end_times[1:]):
+            delta_us = int(round((end_time - previous_end) * 1_000_000))
+            previous_end = end_time
+            gap_us = delta_us - sum(map(abs, frame))
             if gap_us > 0:
                 timestamp_candidates.append(gap_us)
         return timestamp_candidates
@@ -0,0 +1,98 @@
+import os
+import pty
+import select
+import subprocess
+import time
+from typing import List, Optional
+
+
+class IrReceiveStream:
+    """A long-running ``ir-ctl --receive`` whose messages are read one at a time.
+
+    Keeps the receiver open across the frames of a hold capture so each frame does not pay for starting
+    ir-ctl again, and frames arriving between two reads are not lost.
+    """
+
+    def __init__(self, cmd: List[str]) -> None:
+        # ir-ctl writes through stdio, which only flushes per line on a terminal; behind a pipe messages
+        # would sit in its buffer. A pty makes every message readable as soon as ir-ctl finishes it.
+        master_fd, slave_fd = pty.openpty()
+        try:
+            self._proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=slave_fd,
+                stderr=subprocess.PIPE,
+                close_fds=True,
+            )
+        except Exception:
+            os.close(master_fd)
+            raise
+        finally:
+            os.close(slave_fd)
+        self._fd = master_fd
+        self._buffer = ""
+        self._pending: List[str] = []
+        self._stderr: Optional[str] = None
+
+    def read_message(self, timeout_ms: int) -> str:
+        """Return the next message; raises TimeoutError if none completes within timeout_ms."""
+        deadline = time.monotonic() + max(timeout_ms, 0) / 1000.0
+        while True:
+            line = self._read_line(deadline)
+            if not line:
+                continue
+            self._pending.append(line)
+            # ir-ctl ends every message with a timeout marker ("# timeout N", or "timeout N" in mode2).
+            if "timeout" in line:
+                message = "\n".join(self._pending)
+                self._pending = []
+                return message
+
+    def close(self) -> str:
+        """Stop ir-ctl and return whatever it wrote to stderr."""
+        stderr = self._stop()
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        return stderr
+
+    def __enter__(self) -> "IrReceiveStream":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _read_line(self, deadline: float) -> str:
+        while "\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("No IR message received within timeout")
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                raise TimeoutError("No IR message received within timeout")
+            try:
+                chunk = os.read(self._fd, 4096)
+            except OSError:
+                # Linux reports EIO on the pty once ir-ctl has exited.
+                chunk = b""
+            if not chunk:
+                stderr = self._stop()
+                raise ValueError(f"ir-ctl receive failed (code={self._proc.returncode}): {stderr or 'receiver stopped'}")
+            self._buffer += chunk.decode("utf-8", errors="replace")
+        line, self._buffer = self._buffer.split("\n", 1)
+        # The pty translates line endings to CRLF.
+        return line.strip()
+
+    def _stop(self) -> str:
+        # Waits for ir-ctl once and keeps its stderr, so an error raised on exit and close() both report it.
+        if self._stderr is None:
+            if self._proc.poll() is None:
+                self._proc.terminate()
+            try:
+                _, stderr = self._proc.communicate(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                _, stderr = self._proc.communicate()
+            self._stderr = (stderr or b"").decode("utf-8", errors="replace").strip()
+        return self._stderr
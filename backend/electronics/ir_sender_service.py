@@ -1,4 +1,5 @@
 import math
+import os
 import tempfile
 from typing import Any, Dict, Optional
 
@@ -68,56 +69,56 @@ class IrSenderService:
         carrier_hz = int(payload["carrier_hz"]) if payload.get("carrier_hz") else None
         duty_cycle = int(payload["duty_cycle"]) if payload.get("duty_cycle") else None
 
-        with tempfile.TemporaryDirectory(prefix="ir_tx_") as tmpdir:
-            if mode == "press":
-                press_initial = self._parser.decode_pulses(press_initial_text)
-                press_path = f"{tmpdir}/press_initial.txt"
-                self._write_pulse_space_file(press_path, press_initial)
-
-                stdout, stderr = self._engine.send_pulse_space_files(
-                    [press_path],
-                    carrier_hz=carrier_hz,
-                    duty_cycle=duty_cycle,
-                )
-
-                return {
-                    "mode": "press",
-                    "carrier_hz": carrier_hz,
-                    "duty_cycle": duty_cycle,
-                    "gap_us": None,
-                    "repeats": 0,
-                    "stdout": stdout,
-                    "stderr": stderr,
-                }
-
-            if hold_ms is None or int(hold_ms) <= 0:
-                raise ValueError("hold_ms is required for mode=hold")
-
-            hold_initial_text = str(payload.get("hold_initial") or "").strip()
-            hold_repeat_text = str(payload.get("hold_repeat") or "").strip()
-            if not hold_initial_text or not hold_repeat_text:
-                raise ValueError("Hold signals are missing for this button")
-
-            hold_gap_us = payload.get("hold_gap_us")
-            if hold_gap_us is None or int(hold_gap_us) <= 0:
-                raise ValueError("Hold gap is missing for this button; re-capture hold to compute it")
-            hold_gap_us_value = int(hold_gap_us)
-
-            hold_initial = self._parser.decode_pulses(hold_initial_text)
-            hold_repeat = self._parser.decode_pulses(hold_repeat_text)
+        if mode == "press":
+            press_initial = self._parser.decode_pulses(press_initial_text)
+            # A single frame goes to ir-ctl through its stdin, so a press touches no files at all.
+            stdout, stderr = self._engine.send_pulse_space_stream(
+                self._parser.to_pulse_space_text(press_initial),
+                carrier_hz=carrier_hz,
+                duty_cycle=duty_cycle,
+            )
+
+            return {
+                "mode": "press",
+                "carrier_hz": carrier_hz,
+                "duty_cycle": duty_cycle,
+                "gap_us": None,
+                "repeats": 0,
+                "stdout": stdout,
+                "stderr": stderr,
+            }
+
+        if hold_ms is None or int(hold_ms) <= 0:
+            raise ValueError("hold_ms is required for mode=hold")
+
+        hold_initial_text = str(payload.get("hold_initial") or "").strip()
+        hold_repeat_text = str(payload.get("hold_repeat") or "").strip()
+        if not hold_initial_text or not hold_repeat_text:
+            raise ValueError("Hold signals are missing for this button")
+
+        hold_gap_us = payload.get("hold_gap_us")
+        if hold_gap_us is None or int(hold_gap_us) <= 0:
+            raise ValueError("Hold gap is missing for this button; re-capture hold to compute it")
+        hold_gap_us_value = int(hold_gap_us)
+
+        hold_initial = self._parser.decode_pulses(hold_initial_text)
+        hold_repeat = self._parser.decode_pulses(hold_repeat_text)
 
+        repeat_count = self._estimate_repeat_count(
+            hold_ms=int(hold_ms),
+            initial_pulses=hold_initial,
+            repeat_pulses=hold_repeat,
+            gap_us=hold_gap_us_value,
+        )
+
+        # Hold frames stay separate files: ir-ctl caps one transmission at 1024 values (and the kernel at
+        # 500 ms), which a whole hold concatenated into one stream would exceed.
+        with tempfile.TemporaryDirectory(prefix="ir_tx_") as tmpdir:
             initial_path = f"{tmpdir}/hold_initial.txt"
             repeat_path = f"{tmpdir}/hold_repeat.txt"
             self._write_pulse_space_file(initial_path, hold_initial)
             self._write_pulse_space_file(repeat_path, hold_repeat)
 
-            repeat_count = self._estimate_repeat_count(
-                hold_ms=int(hold_ms),
-                initial_pulses=hold_initial,
-                repeat_pulses=hold_repeat,
-                gap_us=hold_gap_us_value,
-            )
-
             file_paths = [initial_path] + [repeat_path] * repeat_count
 
             stdout, stderr = self._engine.send_pulse_space_files(
@@ -127,27 +128,31 @@ class IrSenderService:
                 duty_cycle=duty_cycle,
             )
 
-            return {
-                "mode": "hold",
-                "hold_ms": int(hold_ms),
-                "carrier_hz": carrier_hz,
-                "duty_cycle": duty_cycle,
-                "gap_us": hold_gap_us_value,
-                "repeats": repeat_count,
-                "stdout": stdout,
-                "stderr": stderr,
-            }
+        return {
+            "mode": "hold",
+            "hold_ms": int(hold_ms),
+            "carrier_hz": carrier_hz,
+            "duty_cycle": duty_cycle,
+            "gap_us": hold_gap_us_value,
+            "repeats": repeat_count,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
 
     def _write_pulse_space_file(self, path: str, pulses: list[int]) -> None:
-        text = self._parser.to_pulse_space_text(pulses)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(text)
+        data = self._parser.to_pulse_space_text(pulses).encode("ascii")
+        # ir-ctl reads the file straight from the page cache, so no fsync. The buffered file object retries
+        # short writes until all bytes are written, which a bare os.write() does not.
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
 
     def _estimate_repeat_count(self, hold_ms: int, initial_pulses: list[int], repeat_pulses: list[int], gap_us: Optional[int]) -> int:
         target_us = int(hold_ms) * 1000
 
-        initial_us = sum(abs(int(v)) for v in initial_pulses)
-        repeat_us = sum(abs(int(v)) for v in repeat_pulses)
+        # decode_pulses returns ints, so map(abs) keeps the whole sum in C.
+        initial_us = sum(map(abs, initial_pulses))
+        repeat_us = sum(map(abs, repeat_pulses))
 
         repeat_period_us = repeat_us + (int(gap_us) if gap_us and gap_us > 0 else 0)
 
@@ -1,4 +1,5 @@
 import math
+import operator
 from typing import Dict, List, Tuple
 
 
@@ -16,11 +17,14 @@ class IrSignalAggregator:
         if min_match_ratio <= 0 or min_match_ratio > 1:
             raise ValueError("min_match_ratio must be in (0, 1]")
 
-        clusters: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        # The sign pattern is packed into one byte per position (1 = pulse, 0 = space). map() builds it
+        # in C and the bytes key hashes in one pass, instead of a tuple of boxed ints per frame.
+        is_pulse = (0).__lt__
+        clusters: Dict[Tuple[int, bytes], List[int]] = {}
         for idx, frame in enumerate(frames):
             if not frame:
                 continue
-            key = (len(frame), tuple(1 if v > 0 else -1 for v in frame))
+            key = (len(frame), bytes(map(is_pulse, frame)))
             clusters.setdefault(key, []).append(idx)
 
         if not clusters:
@@ -35,19 +39,17 @@ class IrSignalAggregator:
                 "Increase takes or improve capture conditions."
             )
 
-        length = best_key[0]
         pattern = best_key[1]
 
-        # Median aggregation by position.
+        # Median aggregation by position. zip(*rows) walks the takes column by column in C.
+        abs_rows = [list(map(abs, frames[idx])) for idx in best_indices]
         aggregated: List[int] = []
-        for i in range(length):
-            values = sorted(abs(frames[idx][i]) for idx in best_indices)
-            m = self._median_int(values)
-            rounded = int(round(m / round_to_us) * round_to_us)
-            sign = 1 if pattern[i] > 0 else -1
-            aggregated.append(sign * max(1, rounded))
+        for column, pulse in zip(zip(*abs_rows), pattern):
+            m = self._median_int(sorted(column))
+            rounded = max(1, int(round(m / round_to_us) * round_to_us))
+            aggregated.append(rounded if pulse else -rounded)
 
-        score = self._quality_score(frames, best_indices, aggregated)
+        score = self._quality_score(abs_rows, [abs(v) for v in aggregated])
         return aggregated, best_indices, score
 
     def _median_int(self, values: List[int]) -> int:
@@ -59,21 +61,16 @@ class IrSignalAggregator:
             return int(values[mid])
         return int((values[mid - 1] + values[mid]) / 2)
 
-    def _quality_score(self, frames: List[List[int]], indices: List[int], aggregated: List[int]) -> float:
-        if not indices:
-            return 0.0
-
-        length = len(aggregated)
-        if length == 0:
+    def _quality_score(self, abs_rows: List[List[int]], abs_aggregated: List[int]) -> float:
+        length = len(abs_aggregated)
+        if not abs_rows or length == 0:
             return 0.0
 
         errors: List[float] = []
-        for idx in indices:
-            frame = frames[idx]
-            if len(frame) != length:
+        for row in abs_rows:
+            if len(row) != length:
                 continue
-            diffs = [abs(abs(frame[i]) - abs(aggregated[i])) for i in range(length)]
-            errors.append(sum(diffs) / float(length))
+            errors.append(sum(map(abs, map(operator.sub, row, abs_aggregated))) / float(length))
 
         if not errors:
             return 0.0
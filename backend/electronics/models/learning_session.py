@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from .log_entry import LogEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class LearningSession:
     remote_id: int
     remote_name: str
@@ -14,4 +14,8 @@ class LearningSession:
     next_button_index: int
     last_button_id: Optional[int] = None
     last_button_name: Optional[str] = None
-    logs: List[LogEntry] = field(default_factory=list)
+    # Entries are stored serialized, as status payloads send them, so a payload never rebuilds earlier entries.
+    logs: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_log(self, entry: LogEntry) -> None:
+        self.logs.append(entry.to_dict())
@@ -1,13 +1,15 @@
 import asyncio
-from typing import Any, Dict, Optional, Set
+import json
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import WebSocket
 
 
 class StatusCommunication:
     def __init__(self) -> None:
-        # Track active WebSocket connections for status updates.
-        self._connections: Set[WebSocket] = set()
+        # Active WebSocket connections for status updates. The tuple is replaced, never mutated, under the
+        # lock, so a broadcast can take a snapshot by reading the attribute without locking.
+        self._connections: Tuple[WebSocket, ...] = ()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock: Optional[asyncio.Lock] = None
 
@@ -20,11 +22,11 @@ class StatusCommunication:
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
         async with self._get_lock():
-            self._connections.add(websocket)
+            self._connections = self._connections + (websocket,)
 
     async def disconnect(self, websocket: WebSocket) -> None:
         async with self._get_lock():
-            self._connections.discard(websocket)
+            self._connections = tuple(c for c in self._connections if c is not websocket)
 
     async def send(self, websocket: WebSocket, payload: Dict[str, Any]) -> None:
         # Keep single-client sends separate from broadcast for clarity.
@@ -46,22 +48,22 @@ class StatusCommunication:
             asyncio.run_coroutine_threadsafe(self._broadcast_async(payload), self._loop)
 
     async def _broadcast_async(self, payload: Dict[str, Any]) -> None:
-        async with self._get_lock():
-            connections = list(self._connections)
+        connections = self._connections
         if not connections:
             return
 
-        stale: list[WebSocket] = []
-        for websocket in connections:
-            try:
-                await websocket.send_json(payload)
-            except Exception:
-                stale.append(websocket)
+        # Encode once for every client (the same encoding send_json uses) and let the sends overlap
+        # instead of each waiting behind the previous client's socket.
+        data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        results = await asyncio.gather(
+            *(websocket.send_text(data) for websocket in connections),
+            return_exceptions=True,
+        )
+        stale = [websocket for websocket, result in zip(connections, results) if isinstance(result, Exception)]
 
         if stale:
             async with self._get_lock():
-                for websocket in stale:
-                    self._connections.discard(websocket)
+                self._connections = tuple(c for c in self._connections if c not in stale)
 
     def _get_lock(self) -> asyncio.Lock:
         # Lazily create the lock in the active event loop.
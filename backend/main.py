@@ -484,6 +484,11 @@ def _prune_logs_once() -> None:
 def _prune_logs_loop(stop_event: threading.Event) -> None:
     while not stop_event.wait(_LOG_PRUNE_INTERVAL_SECONDS):
         _prune_logs_once()
+        # Pruning is the largest periodic change to the database, so planner statistics are refreshed after it.
+        try:
+            database.optimize()
+        except Exception as exc:
+            _prune_logger.warning(f"Database optimize failed: {exc}")
 
 
 @asynccontextmanager
@@ -538,6 +543,10 @@ async def lifespan(app: FastAPI):
         agent_log_hub.stop()
         runtime_loader.stop()
         learning.stop()
+        try:
+            database.optimize()
+        except Exception as exc:
+            _prune_logger.warning(f"Database optimize failed: {exc}")
 
 
 app = FastAPI(
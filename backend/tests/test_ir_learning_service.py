@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from typing import Any, Dict, List
+
+from database import Database
+from electronics import IrLearningService
+from electronics.ir_hold_extractor import IrHoldExtractor
+from electronics.ir_signal_aggregator import IrSignalAggregator
+from electronics.ir_signal_parser import IrSignalParser
+
+INITIAL_FRAME = "+9000 -4500 +560 -560 +560 -1690 +560 -40000"
+REPEAT_FRAME = "+9000 -2250 +560 -96000"
+
+
+class FakeStatusCommunication:
+    def __init__(self) -> None:
+        self.payloads: List[Dict[str, Any]] = []
+
+    def broadcast(self, payload: Dict[str, Any]) -> None:
+        self.payloads.append(payload)
+
+
+class FakeAgent:
+    agent_id = "agent-1"
+    capabilities: Dict[str, Any] = {}
+
+    def __init__(self, repeats: int) -> None:
+        self._repeats = repeats
+        self._hold_calls = 0
+
+    def learn_start(self, payload: Dict[str, Any]) -> None:
+        pass
+
+    def learn_capture(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if payload["mode"] == "press":
+            return {"raw": INITIAL_FRAME, "stdout": INITIAL_FRAME, "stderr": ""}
+        self._hold_calls += 1
+        if self._hold_calls == 1:
+            return {"raw": INITIAL_FRAME, "stdout": INITIAL_FRAME, "stderr": "warning: carrier not measured"}
+        if self._hold_calls > self._repeats + 1:
+            raise TimeoutError("no more frames")
+        return {"raw": REPEAT_FRAME}
+
+
+class FakeAgentRegistry:
+    def __init__(self, agent: FakeAgent) -> None:
+        self._agent = agent
+
+    def resolve_agent_for_remote(self, remote_id: int, remote: Dict[str, Any]) -> FakeAgent:
+        return self._agent
+
+    def get_agent_by_id(self, agent_id: str) -> FakeAgent:
+        return self._agent
+
+    def mark_agent_activity(self, agent_id: str) -> None:
+        pass
+
+
+class IrLearningServiceBroadcastTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        database = Database(self._tmp.name)
+        database.init()
+        self.remote_id = int(database.remotes.create(name="TV")["id"])
+
+        self.status_comm = FakeStatusCommunication()
+        aggregator = IrSignalAggregator()
+        self.service = IrLearningService(
+            database=database,
+            agent_registry=FakeAgentRegistry(FakeAgent(repeats=3)),
+            parser=IrSignalParser(),
+            aggregator=aggregator,
+            hold_extractor=IrHoldExtractor(aggregator),
+            debug=True,
+            aggregate_round_to_us=10,
+            aggregate_min_match_ratio=0.6,
+            hold_idle_timeout_ms=300,
+            status_comm=self.status_comm,
+        )
+        self.service.start(self.remote_id, extend=False)
+
+    def test_debug_hold_does_not_broadcast_debug_entries_separately(self) -> None:
+        self.service.capture(self.remote_id, "press", takes=1, timeout_ms=1000, overwrite=False, button_name=None)
+        self.status_comm.payloads.clear()
+
+        self.service.capture(self.remote_id, "hold", takes=1, timeout_ms=1000, overwrite=False, button_name=None)
+
+        # "Capture hold started", "Waiting for IR hold" and "Capture hold finished"; the debug entry rides along.
+        self.assertEqual(len(self.status_comm.payloads), 3)
+        messages = [entry["message"] for entry in self.status_comm.payloads[-1]["logs"]]
+        self.assertIn("ir-ctl output", messages)
+
+    def test_debug_burst_is_coalesced(self) -> None:
+        session = self.service._session
+        self.status_comm.payloads.clear()
+
+        for i in range(50):
+            self.service._log(session, "debug", "ir-ctl output", {"stdout": str(i), "stderr": ""})
+        self.assertLessEqual(len(self.status_comm.payloads), 1)
+
+        self.service._log(session, "info", "Capture hold finished")
+        self.assertEqual(self.status_comm.payloads[-1]["logs"][-1]["message"], "Capture hold finished")
+        self.assertEqual(len(self.status_comm.payloads[-1]["logs"]), 52)
+
+
+if __name__ == "__main__":
+    unittest.main()
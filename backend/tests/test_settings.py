@@ -0,0 +1,40 @@
+import tempfile
+import unittest
+
+from database import Database
+
+
+class SettingsCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.database = Database(self._tmp.name)
+        self.database.init()
+        self.settings = self.database.settings
+        self.settings.set("theme", "light")
+
+    def test_reads_inside_rolled_back_transaction_do_not_reach_the_cache(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with self.database.transaction() as conn:
+                self.settings.set("theme", "dark", conn=conn)
+                self.settings.set("log_retention_days", "30", conn=conn)
+                # Reads without conn inside the block see the uncommitted writes.
+                self.assertEqual(self.settings.get("theme"), "dark")
+                self.assertEqual(self.settings.get_log_settings()["log_retention_days"], 30)
+                raise RuntimeError("rollback")
+
+        self.assertEqual(self.settings.get("theme"), "light")
+        self.assertEqual(self.settings.get_log_settings()["log_retention_days"], 7)
+        self.assertEqual(self.settings.get_ui_settings()["theme"], "light")
+
+    def test_committed_transaction_refreshes_the_cache(self) -> None:
+        self.assertEqual(self.settings.get("theme"), "light")
+        with self.database.transaction() as conn:
+            self.settings.set("theme", "dark", conn=conn)
+
+        self.assertEqual(self.settings.get("theme"), "dark")
+        self.assertEqual(self.settings.get_ui_settings()["theme"], "dark")
+
+
+if __name__ == "__main__":
+    unittest.main()